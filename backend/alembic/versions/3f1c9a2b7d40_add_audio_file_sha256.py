@@ -0,0 +1,36 @@
+"""Add audio_files.sha256 content digest
+
+Revision ID: 3f1c9a2b7d40
+Revises: 0ecea1034870
+Create Date: 2026-10-17 09:12:41.208113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c9a2b7d40"
+down_revision: Union[str, None] = "0ecea1034870"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "audio_files", sa.Column("sha256", sa.String(length=64), nullable=True)
+    )
+    op.create_index(
+        "idx_audio_file_student_sha256",
+        "audio_files",
+        ["student_id", "sha256"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_audio_file_student_sha256", table_name="audio_files")
+    op.drop_column("audio_files", "sha256")
@@ -0,0 +1,73 @@
+"""Store skill and evidence types as VARCHAR with CHECK constraints
+
+Revision ID: 5053f84cf4d2
+Revises: 82a3100fa75b
+Create Date: 2026-10-17 11:40:52.730186
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5053f84cf4d2"
+down_revision: Union[str, None] = "82a3100fa75b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SKILL_TYPES = (
+    "EMPATHY",
+    "ADAPTABILITY",
+    "PROBLEM_SOLVING",
+    "SELF_REGULATION",
+    "RESILIENCE",
+    "COMMUNICATION",
+    "COLLABORATION",
+)
+EVIDENCE_TYPES = ("LINGUISTIC", "BEHAVIORAL", "CONTEXTUAL")
+
+# (table, column, check constraint, native enum type, allowed values)
+ENUM_COLUMNS = (
+    ("skill_assessments", "skill_type", "ck_skill_type", "skilltype", SKILL_TYPES),
+    ("rubric_assessments", "skill_type", "ck_skill_type", "skilltype", SKILL_TYPES),
+    ("evidence", "evidence_type", "ck_evidence_type", "evidencetype", EVIDENCE_TYPES),
+)
+
+
+def _in_list(values: Sequence[str]) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    for table, column, constraint, enum_name, values in ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=32),
+            existing_nullable=False,
+            postgresql_using=f"{column}::text",
+        )
+        op.create_check_constraint(
+            constraint, table, f"{column} IN ({_in_list(values)})"
+        )
+
+    op.execute("DROP TYPE IF EXISTS skilltype")
+    op.execute("DROP TYPE IF EXISTS evidencetype")
+
+
+def downgrade() -> None:
+    op.execute(f"CREATE TYPE skilltype AS ENUM ({_in_list(SKILL_TYPES)})")
+    op.execute(f"CREATE TYPE evidencetype AS ENUM ({_in_list(EVIDENCE_TYPES)})")
+
+    for table, column, constraint, enum_name, values in reversed(ENUM_COLUMNS):
+        op.drop_constraint(constraint, table, type_="check")
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Enum(*values, name=enum_name, create_type=False),
+            existing_nullable=False,
+            postgresql_using=f"{column}::{enum_name}",
+        )
@@ -0,0 +1,44 @@
+"""Add composite indexes on transcripts and users
+
+Revision ID: 7d52f0c1e9a3
+Revises: e6b13d8a4c27
+Create Date: 2026-10-17 14:10:26.517093
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7d52f0c1e9a3"
+down_revision: Union[str, None] = "e6b13d8a4c27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_transcript_student_created",
+        "transcripts",
+        ["student_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index("ix_transcripts_student_id", table_name="transcripts")
+    op.create_index(
+        "idx_user_school_role_active",
+        "users",
+        ["school_id", "role", "is_active"],
+        unique=False,
+    )
+    op.drop_index("ix_users_role", table_name="users")
+
+
+def downgrade() -> None:
+    op.create_index("ix_users_role", "users", ["role"], unique=False)
+    op.drop_index("idx_user_school_role_active", table_name="users")
+    op.create_index(
+        "ix_transcripts_student_id", "transcripts", ["student_id"], unique=False
+    )
+    op.drop_index("idx_transcript_student_created", table_name="transcripts")
@@ -0,0 +1,45 @@
+"""Add game_telemetry (session_id, timestamp) index and drop redundant ones
+
+Revision ID: 82a3100fa75b
+Revises: 8b2e4d61c9a3
+Create Date: 2026-10-17 11:02:38.419265
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "82a3100fa75b"
+down_revision: Union[str, None] = "8b2e4d61c9a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_telemetry_session_ts",
+        "game_telemetry",
+        ["session_id", "timestamp"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_game_telemetry_session_id"), table_name="game_telemetry")
+    op.drop_index(op.f("ix_game_telemetry_event_type"), table_name="game_telemetry")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_game_telemetry_event_type"),
+        "game_telemetry",
+        ["event_type"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_game_telemetry_session_id"),
+        "game_telemetry",
+        ["session_id"],
+        unique=False,
+    )
+    op.drop_index("idx_telemetry_session_ts", table_name="game_telemetry")
@@ -0,0 +1,37 @@
+"""Add indexes for RBAC student access checks
+
+Revision ID: 8b2e4d61c9a3
+Revises: 3f1c9a2b7d40
+Create Date: 2026-10-17 10:05:17.532904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b2e4d61c9a3"
+down_revision: Union[str, None] = "3f1c9a2b7d40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_student_school_id_id", "students", ["school_id", "id"], unique=False
+    )
+    op.create_index(op.f("ix_teachers_user_id"), "teachers", ["user_id"], unique=False)
+    op.create_index(
+        "idx_teacher_student_student_teacher",
+        "teacher_student",
+        ["student_id", "teacher_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_teacher_student_student_teacher", table_name="teacher_student")
+    op.drop_index(op.f("ix_teachers_user_id"), table_name="teachers")
+    op.drop_index("idx_student_school_id_id", table_name="students")
@@ -0,0 +1,64 @@
+"""Store feature and telemetry JSON columns as JSONB
+
+Revision ID: a17b89d79620
+Revises: 5053f84cf4d2
+Create Date: 2026-10-17 12:14:09.562871
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a17b89d79620"
+down_revision: Union[str, None] = "5053f84cf4d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, nullable)
+JSON_COLUMNS = (
+    ("linguistic_features", "word_embeddings", True),
+    ("linguistic_features", "features_json", False),
+    ("behavioral_features", "features_json", False),
+    ("game_telemetry", "event_data", False),
+)
+
+
+def upgrade() -> None:
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::jsonb",
+        )
+    op.create_index(
+        "idx_ling_features_gin",
+        "linguistic_features",
+        ["features_json"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_ling_features_gin",
+        table_name="linguistic_features",
+        postgresql_using="gin",
+    )
+    for table, column, nullable in reversed(JSON_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,52 @@
+"""Store transcripts.word_data as JSONB with a GIN index
+
+Revision ID: b38e6a90d4f5
+Revises: 7d52f0c1e9a3
+Create Date: 2026-10-17 14:31:58.604217
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b38e6a90d4f5"
+down_revision: Union[str, None] = "7d52f0c1e9a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "transcripts",
+        "word_data",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="word_data::jsonb",
+    )
+    op.create_index(
+        "idx_transcript_word_data_gin",
+        "transcripts",
+        ["word_data"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_transcript_word_data_gin", table_name="transcripts", postgresql_using="gin"
+    )
+    op.alter_column(
+        "transcripts",
+        "word_data",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="word_data::json",
+    )
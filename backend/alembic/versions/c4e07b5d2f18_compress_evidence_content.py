@@ -0,0 +1,73 @@
+"""Store evidence.content as zstd-compressed BYTEA
+
+Revision ID: c4e07b5d2f18
+Revises: a17b89d79620
+Create Date: 2026-10-17 13:02:37.418625
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import zstandard
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e07b5d2f18"
+down_revision: Union[str, None] = "a17b89d79620"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def _convert(source: str, target: str, transform) -> None:
+    """Copy evidence.<source> into evidence.<target> in batches, transforming each value."""
+    conn = op.get_bind()
+    result = conn.execution_options(stream_results=True).execute(
+        sa.text(f"SELECT id, {source} FROM evidence")
+    )
+    update = sa.text(f"UPDATE evidence SET {target} = :value WHERE id = :id")
+    while rows := result.fetchmany(BATCH_SIZE):
+        conn.execute(
+            update, [{"id": row[0], "value": transform(row[1])} for row in rows]
+        )
+
+
+def upgrade() -> None:
+    compressor = zstandard.ZstdCompressor(level=3)
+    op.add_column(
+        "evidence", sa.Column("content_zstd", sa.LargeBinary(), nullable=True)
+    )
+    _convert(
+        "content",
+        "content_zstd",
+        lambda text: compressor.compress(text.encode("utf-8")),
+    )
+    op.drop_column("evidence", "content")
+    op.alter_column(
+        "evidence",
+        "content_zstd",
+        new_column_name="content",
+        existing_type=sa.LargeBinary(),
+        nullable=False,
+    )
+
+
+def downgrade() -> None:
+    decompressor = zstandard.ZstdDecompressor()
+    op.add_column("evidence", sa.Column("content_text", sa.Text(), nullable=True))
+    _convert(
+        "content",
+        "content_text",
+        lambda data: decompressor.decompress(data).decode("utf-8"),
+    )
+    op.drop_column("evidence", "content")
+    op.alter_column(
+        "evidence",
+        "content_text",
+        new_column_name="content",
+        existing_type=sa.Text(),
+        nullable=False,
+    )
@@ -0,0 +1,45 @@
+"""Store users.role as a plain VARCHAR of role values
+
+Revision ID: e6b13d8a4c27
+Revises: c4e07b5d2f18
+Create Date: 2026-10-17 13:48:15.902364
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b13d8a4c27"
+down_revision: Union[str, None] = "c4e07b5d2f18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+USER_ROLES = ("STUDENT", "TEACHER", "ADMINISTRATOR", "COUNSELOR", "SYSTEM_ADMIN")
+
+
+def upgrade() -> None:
+    # The native enum stored member names; the column now holds the lowercase values
+    op.alter_column(
+        "users",
+        "role",
+        type_=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using="lower(role::text)",
+    )
+    op.execute("DROP TYPE IF EXISTS userrole")
+
+
+def downgrade() -> None:
+    roles = ", ".join(f"'{role}'" for role in USER_ROLES)
+    op.execute(f"CREATE TYPE userrole AS ENUM ({roles})")
+    op.alter_column(
+        "users",
+        "role",
+        type_=sa.Enum(*USER_ROLES, name="userrole", create_type=False),
+        existing_nullable=False,
+        postgresql_using="upper(role)::userrole",
+    )
@@ -15,7 +15,6 @@ from app.schemas.assessment import (
     BatchAssessmentRequest,
     BatchAssessmentResponse,
     AssessmentSummary,
-    EvidenceSchema,
 )
 
 logger = logging.getLogger(__name__)
@@ -63,27 +62,7 @@ async def create_skill_assessment(
         )
 
         # Format response
-        return AssessmentResponse(
-            id=assessment.id,
-            student_id=assessment.student_id,
-            skill_type=assessment.skill_type.value,
-            score=assessment.score,
-            confidence=assessment.confidence,
-            reasoning=assessment.reasoning,
-            recommendations=assessment.recommendations,
-            evidence=[
-                EvidenceSchema(
-                    id=e.id,
-                    evidence_type=e.evidence_type.value,
-                    source=e.source,
-                    content=e.content,
-                    relevance_score=e.relevance_score,
-                )
-                for e in assessment.evidence
-            ],
-            created_at=assessment.created_at,
-            updated_at=assessment.updated_at,
-        )
+        return AssessmentResponse.from_orm_fast(assessment)
 
     except ValueError as e:
         logger.error(f"Validation error: {e}")
@@ -137,28 +116,7 @@ async def create_all_assessments(
 
         # Format response
         assessment_responses = [
-            AssessmentResponse(
-                id=a.id,
-                student_id=a.student_id,
-                skill_type=a.skill_type.value,
-                score=a.score,
-                confidence=a.confidence,
-                reasoning=a.reasoning,
-                recommendations=a.recommendations,
-                evidence=[
-                    EvidenceSchema(
-                        id=e.id,
-                        evidence_type=e.evidence_type.value,
-                        source=e.source,
-                        content=e.content,
-                        relevance_score=e.relevance_score,
-                    )
-                    for e in a.evidence
-                ],
-                created_at=a.created_at,
-                updated_at=a.updated_at,
-            )
-            for a in assessments
+            AssessmentResponse.from_orm_fast(a) for a in assessments
         ]
 
         return AssessmentSummary(
@@ -233,27 +191,7 @@ async def batch_create_assessments(
 
                 results["successful"] += 1
                 results["assessments"].append(
-                    AssessmentResponse(
-                        id=assessment.id,
-                        student_id=assessment.student_id,
-                        skill_type=assessment.skill_type.value,
-                        score=assessment.score,
-                        confidence=assessment.confidence,
-                        reasoning=assessment.reasoning,
-                        recommendations=assessment.recommendations,
-                        evidence=[
-                            EvidenceSchema(
-                                id=e.id,
-                                evidence_type=e.evidence_type.value,
-                                source=e.source,
-                                content=e.content,
-                                relevance_score=e.relevance_score,
-                            )
-                            for e in assessment.evidence
-                        ],
-                        created_at=assessment.created_at,
-                        updated_at=assessment.updated_at,
-                    )
+                    AssessmentResponse.from_orm_fast(assessment)
                 )
 
             except Exception as e:
@@ -323,30 +261,7 @@ async def get_student_assessments(
         result = await db.execute(query)
         assessments = result.scalars().all()
 
-        return [
-            AssessmentResponse(
-                id=a.id,
-                student_id=a.student_id,
-                skill_type=a.skill_type.value,
-                score=a.score,
-                confidence=a.confidence,
-                reasoning=a.reasoning,
-                recommendations=a.recommendations,
-                evidence=[
-                    EvidenceSchema(
-                        id=e.id,
-                        evidence_type=e.evidence_type.value,
-                        source=e.source,
-                        content=e.content,
-                        relevance_score=e.relevance_score,
-                    )
-                    for e in a.evidence
-                ],
-                created_at=a.created_at,
-                updated_at=a.updated_at,
-            )
-            for a in assessments
-        ]
+        return [AssessmentResponse.from_orm_fast(a) for a in assessments]
 
     except HTTPException:
         raise
@@ -409,24 +324,4 @@ async def get_latest_assessment(
             detail=f"No {skill_type} assessment found for student {student_id}",
         )
 
-    return AssessmentResponse(
-        id=assessment.id,
-        student_id=assessment.student_id,
-        skill_type=assessment.skill_type.value,
-        score=assessment.score,
-        confidence=assessment.confidence,
-        reasoning=assessment.reasoning,
-        recommendations=assessment.recommendations,
-        evidence=[
-            EvidenceSchema(
-                id=e.id,
-                evidence_type=e.evidence_type.value,
-                source=e.source,
-                content=e.content,
-                relevance_score=e.relevance_score,
-            )
-            for e in assessment.evidence
-        ],
-        created_at=assessment.created_at,
-        updated_at=assessment.updated_at,
-    )
+    return AssessmentResponse.from_orm_fast(assessment)
@@ -1,7 +1,8 @@
 """Telemetry ingestion endpoints for game events."""
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from pydantic import BaseModel, ValidationError
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
@@ -13,6 +14,7 @@ from app.api.endpoints.auth import get_current_user, TokenData
 from app.core.database import get_db
 from app.services.telemetry_processor import TelemetryProcessor
 from app.schemas.telemetry import (
+    MAX_BATCH_EVENTS,
     TelemetryEventCreate,
     TelemetryBatchCreate,
 )
@@ -21,6 +23,46 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 limiter = Limiter(key_func=get_remote_address)
 
+# Largest legitimate batch is MAX_BATCH_EVENTS events of up to ~10KB data
+# each; anything bigger is rejected before any JSON is parsed
+_MAX_BATCH_BODY_BYTES = MAX_BATCH_EVENTS * 12 * 1024
+
+# Built once at import; validates raw batch bodies in pydantic-core
+_BATCH_ADAPTER = TypeAdapter(TelemetryBatchCreate)
+
+# Batch request body schema for OpenAPI; nested events reference the
+# TelemetryEventCreate component registered by the single-event endpoint
+_BATCH_BODY_SCHEMA = _BATCH_ADAPTER.json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+_BATCH_BODY_SCHEMA.pop("$defs", None)
+
+
+async def parse_telemetry_batch(request: Request) -> TelemetryBatchCreate:
+    """
+    Parse and validate a telemetry batch straight from the raw JSON body.
+
+    Pydantic parses and validates the bytes in one pass, instead of FastAPI
+    building a dict tree with json.loads and validating that afterwards.
+    Errors keep FastAPI's 422 response shape. Bodies over
+    _MAX_BATCH_BODY_BYTES are refused with 413 while still being received.
+    """
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > _MAX_BATCH_BODY_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Batch body too large (max {_MAX_BATCH_BODY_BYTES} bytes)",
+            )
+
+    try:
+        return _BATCH_ADAPTER.validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+
 
 class TelemetryResponse(BaseModel):
     """Telemetry ingestion response."""
@@ -97,11 +139,17 @@ async def ingest_event(
     status_code=status.HTTP_201_CREATED,
     summary="Ingest batch of telemetry events",
     description="Receive and process multiple game telemetry events in a single request",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _BATCH_BODY_SCHEMA}},
+        }
+    },
 )
 @limiter.limit("10/minute")
 async def ingest_batch(
     request: Request,
-    batch: TelemetryBatchCreate,
+    batch: TelemetryBatchCreate = Depends(parse_telemetry_batch),
     db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user),
 ):
@@ -137,18 +185,18 @@ async def ingest_batch(
                 }
             )
 
-        # Process batch
-        processed_events = await processor.process_batch(
+        # Store the batch in one bulk write
+        accepted_count = await processor.bulk_ingest(
             events=event_dicts,
             batch_id=str(batch.batch_id),
         )
 
         return TelemetryResponse(
             status="processed",
-            received_count=len(processed_events),
+            received_count=accepted_count,
             batch_id=str(batch.batch_id),
             message=(
-                f"Batch processed: {len(processed_events)}/"
+                f"Batch processed: {accepted_count}/"
                 f"{len(batch.events)} events stored successfully"
             ),
         )
@@ -12,8 +12,11 @@ from fastapi import (
 )
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+import hashlib
 import tempfile
 import os
 import uuid
@@ -28,6 +31,12 @@ from app.services.transcription import TranscriptionService
 
 router = APIRouter()
 
+# Read uploads in 1 MiB chunks so large recordings never sit fully in memory
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Rows fetched per round-trip when streaming audio file listings
+AUDIO_LIST_YIELD_PER = 200
+
 
 # Pydantic models for request/response
 class AudioUploadRequest(BaseModel):
@@ -53,8 +62,9 @@ class AudioFileResponse(BaseModel):
     source_type: str
     recording_date: Optional[str]
     transcription_status: str
-    created_at: str
-    updated_at: str
+    sha256: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
 
 
 class TranscriptResponse(BaseModel):
@@ -68,7 +78,7 @@ class TranscriptResponse(BaseModel):
     confidence_score: Optional[float]
     language_code: str
     word_data: Optional[Dict[str, Any]]
-    created_at: str
+    created_at: datetime
 
 
 class TranscriptionJobResponse(BaseModel):
@@ -79,6 +89,36 @@ class TranscriptionJobResponse(BaseModel):
     message: str
 
 
+def _audio_file_response(audio_file: AudioFile) -> AudioFileResponse:
+    """Build an AudioFileResponse from an AudioFile row."""
+    return AudioFileResponse(
+        id=audio_file.id,
+        student_id=audio_file.student_id,
+        storage_path=audio_file.storage_path,
+        duration_seconds=audio_file.duration_seconds,
+        file_size_bytes=audio_file.file_size_bytes,
+        source_type=audio_file.source_type,
+        recording_date=audio_file.recording_date,
+        transcription_status=audio_file.transcription_status,
+        sha256=audio_file.sha256,
+        created_at=audio_file.created_at,
+        updated_at=audio_file.updated_at,
+    )
+
+
+async def _find_audio_by_sha256(
+    db: AsyncSession, student_id: str, content_sha256: str
+) -> Optional[AudioFile]:
+    """Return the student's AudioFile with the given content hash, if any."""
+    result = await db.execute(
+        select(AudioFile).where(
+            AudioFile.student_id == student_id,
+            AudioFile.sha256 == content_sha256,
+        )
+    )
+    return result.scalar_one_or_none()
+
+
 def get_transcription_service() -> TranscriptionService:
     """Dependency for getting transcription service."""
     return TranscriptionService(
@@ -139,12 +179,21 @@ async def upload_audio(
         file_extension = os.path.splitext(file.filename)[1] if file.filename else ".wav"
         unique_filename = f"{student_id}/{uuid.uuid4()}{file_extension}"
 
-        # Save to temp file
+        # Stream to temp file, hashing each chunk as it is written
+        digest = hashlib.sha256()
+        file_size = 0
         with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp:
             temp_file = temp.name
-            content = await file.read()
-            temp.write(content)
-            file_size = len(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                temp.write(chunk)
+                file_size += len(chunk)
+        content_sha256 = digest.hexdigest()
+
+        # Skip re-uploading content this student has already submitted
+        audio_file = await _find_audio_by_sha256(db, student_id, content_sha256)
+        if audio_file:
+            return _audio_file_response(audio_file)
 
         # Upload to GCS
         gcs_uri = await transcription_service.upload_audio_to_gcs(
@@ -160,24 +209,24 @@ async def upload_audio(
             source_type=source_type,
             recording_date=recording_date,
             transcription_status="pending",
+            sha256=content_sha256,
         )
 
         db.add(audio_file)
-        await db.commit()
+        try:
+            await db.commit()
+        except IntegrityError:
+            # A concurrent upload of the same content won the unique index;
+            # return its record and drop the blob we just wrote.
+            await db.rollback()
+            existing = await _find_audio_by_sha256(db, student_id, content_sha256)
+            if existing is None:
+                raise
+            await transcription_service.delete_audio_from_gcs(unique_filename)
+            return _audio_file_response(existing)
         await db.refresh(audio_file)
 
-        return AudioFileResponse(
-            id=audio_file.id,
-            student_id=audio_file.student_id,
-            storage_path=audio_file.storage_path,
-            duration_seconds=audio_file.duration_seconds,
-            file_size_bytes=audio_file.file_size_bytes,
-            source_type=audio_file.source_type,
-            recording_date=audio_file.recording_date,
-            transcription_status=audio_file.transcription_status,
-            created_at=audio_file.created_at.isoformat(),
-            updated_at=audio_file.updated_at.isoformat(),
-        )
+        return _audio_file_response(audio_file)
 
     except Exception as e:
         raise HTTPException(
@@ -304,7 +353,7 @@ async def get_transcript(
         confidence_score=transcript.confidence_score,
         language_code=transcript.language_code,
         word_data=transcript.word_data,
-        created_at=transcript.created_at.isoformat(),
+        created_at=transcript.created_at,
     )
 
 
@@ -345,8 +394,8 @@ async def get_transcription_status(
         "audio_file_id": audio_file.id,
         "status": audio_file.transcription_status,
         "student_id": audio_file.student_id,
-        "created_at": audio_file.created_at.isoformat(),
-        "updated_at": audio_file.updated_at.isoformat(),
+        "created_at": audio_file.created_at,
+        "updated_at": audio_file.updated_at,
     }
 
 
@@ -388,28 +437,14 @@ async def list_student_audio(
             detail=f"Student {student_id} not found",
         )
 
-    # Get audio files
-    result = await db.execute(
+    # Stream audio files and build responses in a single pass
+    audio_files = await db.stream_scalars(
         select(AudioFile)
         .where(AudioFile.student_id == student_id)
         .offset(skip)
         .limit(limit)
         .order_by(AudioFile.created_at.desc())
+        .execution_options(yield_per=AUDIO_LIST_YIELD_PER)
     )
-    audio_files = result.scalars().all()
-
-    return [
-        AudioFileResponse(
-            id=audio.id,
-            student_id=audio.student_id,
-            storage_path=audio.storage_path,
-            duration_seconds=audio.duration_seconds,
-            file_size_bytes=audio.file_size_bytes,
-            source_type=audio.source_type,
-            recording_date=audio.recording_date,
-            transcription_status=audio.transcription_status,
-            created_at=audio.created_at.isoformat(),
-            updated_at=audio.updated_at.isoformat(),
-        )
-        for audio in audio_files
-    ]
+
+    return [_audio_file_response(audio) async for audio in audio_files]
@@ -0,0 +1,202 @@
+"""Response compression middleware negotiating zstd, brotli and gzip."""
+
+import zlib
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Optional encoders; gzip (zlib) is always available
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Server preference order, best first
+_SUPPORTED_ENCODINGS: Tuple[str, ...] = tuple(
+    encoding
+    for encoding, available in (
+        ("zstd", ZSTD_AVAILABLE),
+        ("br", BROTLI_AVAILABLE),
+        ("gzip", True),
+    )
+    if available
+)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the preferred supported encoding the client accepts.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+
+    Returns:
+        "zstd", "br" or "gzip", or None if no supported encoding is accepted
+    """
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+
+    for encoding in _SUPPORTED_ENCODINGS:
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+class _StreamEncoder:
+    """Incremental encoder with a uniform compress/finish interface."""
+
+    def __init__(self, encoding: str, zstd_level: int, gzip_level: int):
+        if encoding == "zstd":
+            # Streaming needs its own compression context per response
+            obj = zstandard.ZstdCompressor(level=zstd_level).compressobj()
+            self._compress, self._finish = obj.compress, obj.flush
+        elif encoding == "br":
+            obj = brotli.Compressor()
+            self._compress, self._finish = obj.process, obj.finish
+        else:
+            obj = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._compress, self._finish = obj.compress, obj.flush
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+class CompressionMiddleware:
+    """
+    Compress responses using the best encoding the client accepts.
+
+    Prefers zstd, then brotli, then gzip. zstd and brotli are used only when
+    their packages are installed; otherwise this behaves like GZipMiddleware.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        zstd_level: int = 3,
+        gzip_level: int = 6,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.zstd_level = zstd_level
+        self.gzip_level = gzip_level
+        # Shared for one-shot bodies; compress() runs without yielding to the loop
+        self._zstd = (
+            zstandard.ZstdCompressor(level=zstd_level) if ZSTD_AVAILABLE else None
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            encoding = negotiate_encoding(
+                Headers(scope=scope).get("Accept-Encoding", "")
+            )
+            if encoding is not None:
+                responder = _CompressionResponder(self, encoding, send)
+                await self.app(scope, receive, responder.send)
+                return
+
+        await self.app(scope, receive, send)
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        """Compress a complete response body in one call."""
+        if encoding == "zstd":
+            return self._zstd.compress(body)
+        if encoding == "br":
+            return brotli.compress(body)
+        obj = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return obj.compress(body) + obj.flush()
+
+
+class _CompressionResponder:
+    """Per-response send wrapper applying the negotiated encoding."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.encoder: Optional[_StreamEncoder] = None
+
+    async def send(self, message: Message):
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # Defer until the first body chunk tells us whether to compress
+            self.initial_message = message
+            self.passthrough = "content-encoding" in Headers(raw=message["headers"])
+            return
+
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.passthrough:
+            if not self.started:
+                self.started = True
+                await self._send(self.initial_message)
+            await self._send(message)
+            return
+
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+
+            if len(body) < self.middleware.minimum_size and not more_body:
+                # Too small to be worth compressing
+                await self._send(self.initial_message)
+                await self._send(message)
+                return
+
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body:
+                body = self.middleware.compress(self.encoding, body)
+                headers["Content-Length"] = str(len(body))
+                message["body"] = body
+            else:
+                del headers["Content-Length"]
+                self.encoder = _StreamEncoder(
+                    self.encoding,
+                    self.middleware.zstd_level,
+                    self.middleware.gzip_level,
+                )
+                message["body"] = self.encoder.compress(body)
+
+            await self._send(self.initial_message)
+            await self._send(message)
+            return
+
+        # Subsequent chunks of a streaming response
+        chunk = self.encoder.compress(body)
+        if not more_body:
+            chunk += self.encoder.finish()
+        message["body"] = chunk
+        await self._send(message)
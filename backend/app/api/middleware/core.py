@@ -0,0 +1,99 @@
+"""Core request middleware: request ID, request logging and error handling."""
+
+import time
+import uuid
+import logging
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from fastapi import status
+
+logger = logging.getLogger(__name__)
+
+
+class CoreMiddleware:
+    """
+    Pure ASGI middleware fusing request ID, logging and error handling.
+
+    One call layer per request instead of three BaseHTTPMiddleware layers:
+    - Generates or propagates ``X-Request-ID`` and stores it on request.state
+    - Logs request start/completion and sets ``X-Process-Time``
+    - Turns unhandled exceptions into a JSON 500 response
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Generate or extract request ID
+        request_id = Headers(scope=scope).get("X-Request-ID") or str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+
+        logger.info(
+            "Request started",
+            extra={
+                "request_id": request_id,
+                "method": method,
+                "path": path,
+                "client": client[0] if client else "unknown",
+            },
+        )
+
+        start_time = time.perf_counter()
+        response_started = False
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started, status_code
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Process-Time"] = str(time.perf_counter() - start_time)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            logger.error(
+                f"Unhandled exception: {str(exc)}",
+                extra={
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "error_type": type(exc).__name__,
+                },
+                exc_info=True,
+            )
+            if response_started:
+                raise
+
+            response = JSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={
+                    "error": "Internal Server Error",
+                    "message": "An unexpected error occurred. Please try again later.",
+                    "request_id": request_id,
+                },
+            )
+            await response(scope, receive, send_wrapper)
+        finally:
+            logger.info(
+                "Request completed",
+                extra={
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "status_code": status_code,
+                    "duration_ms": round((time.perf_counter() - start_time) * 1000, 2),
+                },
+            )
@@ -1,43 +0,0 @@
-"""Error handling middleware."""
-
-import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse
-from fastapi import status
-
-logger = logging.getLogger(__name__)
-
-
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """Global error handler for unhandled exceptions."""
-
-    async def dispatch(self, request: Request, call_next):
-        try:
-            response = await call_next(request)
-            return response
-        except Exception as exc:
-            # Get request ID
-            request_id = getattr(request.state, "request_id", "unknown")
-
-            # Log error
-            logger.error(
-                f"Unhandled exception: {str(exc)}",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "error_type": type(exc).__name__,
-                },
-                exc_info=True,
-            )
-
-            # Return error response
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "error": "Internal Server Error",
-                    "message": "An unexpected error occurred. Please try again later.",
-                    "request_id": request_id,
-                },
-            )
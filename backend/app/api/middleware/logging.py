@@ -1,53 +0,0 @@
-"""Logging middleware for request/response logging."""
-
-import time
-import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-
-logger = logging.getLogger(__name__)
-
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Log all incoming requests and responses."""
-
-    async def dispatch(self, request: Request, call_next):
-        # Start timer
-        start_time = time.time()
-
-        # Get request ID
-        request_id = getattr(request.state, "request_id", "unknown")
-
-        # Log request
-        logger.info(
-            f"Request started",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "client": request.client.host if request.client else "unknown",
-            },
-        )
-
-        # Process request
-        response = await call_next(request)
-
-        # Calculate duration
-        duration = time.time() - start_time
-
-        # Log response
-        logger.info(
-            f"Request completed",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "duration_ms": round(duration * 1000, 2),
-            },
-        )
-
-        # Add timing header
-        response.headers["X-Process-Time"] = str(duration)
-
-        return response
@@ -1,24 +0,0 @@
-"""Request ID middleware for tracing requests."""
-
-import uuid
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-
-
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Add unique request ID to each request for tracing."""
-
-    async def dispatch(self, request: Request, call_next):
-        # Generate or extract request ID
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-
-        # Add to request state
-        request.state.request_id = request_id
-
-        # Process request
-        response = await call_next(request)
-
-        # Add to response headers
-        response.headers["X-Request-ID"] = request_id
-
-        return response
@@ -52,12 +52,15 @@ async def init_db():
         # Enable TimescaleDB extension
         await conn.execute("CREATE EXTENSION IF NOT EXISTS timescaledb CASCADE;")
 
-        # Convert game_telemetry to hypertable
+        # Convert game_telemetry to hypertable, chunked by time and by a hash
+        # of student_id so per-student queries touch only that student's chunks
         await conn.execute(
             """
             SELECT create_hypertable(
                 'game_telemetry',
                 'timestamp',
+                partitioning_column => 'student_id',
+                number_partitions => 16,
                 if_not_exists => TRUE,
                 migrate_data => TRUE
             );
@@ -1,11 +1,15 @@
 """Configuration management for evidence fusion weights."""
 
-import json
 import logging
-from typing import Dict, Optional
+import mmap
+from typing import Any, Callable, Dict, Optional
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+
+import orjson
 
 from app.models.assessment import SkillType
 
@@ -21,7 +25,50 @@ class EvidenceSource(str, Enum):
     CONFIDENCE_ADJUSTMENT = "confidence_adjustment"
 
 
-@dataclass
+# Plain-string source keys, resolved once instead of per serialization
+_EV_ML = EvidenceSource.ML_INFERENCE.value
+_EV_LING = EvidenceSource.LINGUISTIC_FEATURES.value
+_EV_BEH = EvidenceSource.BEHAVIORAL_FEATURES.value
+_EV_CONF = EvidenceSource.CONFIDENCE_ADJUSTMENT.value
+
+# Generated trusted constructors, keyed by dataclass type
+_TRUSTED_CONSTRUCTORS: Dict[type, Callable[[type, Dict[str, Any]], Any]] = {}
+
+
+def _build_trusted_constructor(cls: type) -> Callable[[type, Dict[str, Any]], Any]:
+    """
+    Generate a constructor that assigns each dataclass field from a dict.
+
+    The function body is emitted once per class with the field names
+    hardcoded, so loading skips __init__/__post_init__ and **kwargs handling.
+    Only use it for data produced by the class's own to_dict.
+
+    Args:
+        cls: Dataclass to generate the constructor for
+
+    Returns:
+        Function taking (cls, data) and returning an instance
+    """
+    if cls in _TRUSTED_CONSTRUCTORS:
+        return _TRUSTED_CONSTRUCTORS[cls]
+
+    lines = ["def _from_trusted_dict(cls, data):", "    obj = _new(cls)"]
+    lines += [f"    obj.{f.name} = data[{f.name!r}]" for f in fields(cls)]
+    lines.append("    return obj")
+
+    namespace: Dict[str, Any] = {"_new": object.__new__}
+    exec("\n".join(lines), namespace)
+    constructor = namespace["_from_trusted_dict"]
+    constructor.__qualname__ = f"{cls.__name__}._from_trusted_dict"
+    constructor.__doc__ = (
+        f"Build {cls.__name__} from a trusted dict without validation."
+    )
+
+    _TRUSTED_CONSTRUCTORS[cls] = constructor
+    return constructor
+
+
+@dataclass(slots=True)
 class SkillWeights:
     """Weights for a specific skill."""
 
@@ -48,14 +95,17 @@ class SkillWeights:
     def to_dict(self) -> Dict[str, float]:
         """Convert to dictionary."""
         return {
-            EvidenceSource.ML_INFERENCE.value: self.ml_inference,
-            EvidenceSource.LINGUISTIC_FEATURES.value: self.linguistic_features,
-            EvidenceSource.BEHAVIORAL_FEATURES.value: self.behavioral_features,
-            EvidenceSource.CONFIDENCE_ADJUSTMENT.value: self.confidence_adjustment,
+            _EV_ML: self.ml_inference,
+            _EV_LING: self.linguistic_features,
+            _EV_BEH: self.behavioral_features,
+            _EV_CONF: self.confidence_adjustment,
         }
 
 
-@dataclass
+SkillWeights._from_trusted_dict = classmethod(_build_trusted_constructor(SkillWeights))
+
+
+@dataclass(slots=True)
 class FusionConfig:
     """Configuration for evidence fusion weights."""
 
@@ -66,7 +116,8 @@ class FusionConfig:
     def __post_init__(self):
         """Initialize with default weights if not provided."""
         if not self.weights:
-            self.weights = self._get_default_weights()
+            # SkillWeights are replaced, never mutated, so sharing them is safe
+            self.weights = dict(_DEFAULT_WEIGHTS)
 
     @staticmethod
     def _get_default_weights() -> Dict[str, SkillWeights]:
@@ -136,7 +187,7 @@ class FusionConfig:
             "version": self.version,
             "description": self.description,
             "weights": {
-                skill: asdict(weights) for skill, weights in self.weights.items()
+                skill: weights.to_dict() for skill, weights in self.weights.items()
             },
         }
 
@@ -145,6 +196,9 @@ class FusionConfig:
         """
         Create from dictionary.
 
+        Weights are trusted as previously validated (see save) and are not
+        re-checked; use SkillWeights(...) for untrusted input.
+
         Args:
             data: Dictionary with config data
 
@@ -153,7 +207,7 @@ class FusionConfig:
         """
         weights = {}
         for skill, weight_data in data.get("weights", {}).items():
-            weights[skill] = SkillWeights(**weight_data)
+            weights[skill] = SkillWeights._from_trusted_dict(weight_data)
 
         return cls(
             version=data.get("version", "1.0.0"),
@@ -170,8 +224,8 @@ class FusionConfig:
         """
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
 
         logger.info(f"Saved fusion config to {path}")
 
@@ -192,13 +246,21 @@ class FusionConfig:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        with open(path, "r") as f:
-            data = json.load(f)
+        # Parse straight from the mapped pages, skipping the read() copy
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            with memoryview(mapped) as view:
+                data = orjson.loads(view)
 
         logger.info(f"Loaded fusion config from {path}")
         return cls.from_dict(data)
 
 
+# Default weights, built and validated once at import time
+_DEFAULT_WEIGHTS = MappingProxyType(FusionConfig._get_default_weights())
+
+
 class FusionConfigManager:
     """Manager for fusion configuration with file and in-memory storage."""
 
@@ -257,8 +319,14 @@ class FusionConfigManager:
         return self.get_config()
 
 
-# Global config manager instance
-_config_manager: Optional[FusionConfigManager] = None
+# Config path captured from the first get_fusion_config_manager call
+_config_path: Optional[Path] = None
+
+
+@lru_cache(maxsize=1)
+def _build_config_manager() -> FusionConfigManager:
+    """Create the global fusion config manager (cached after first call)."""
+    return FusionConfigManager(_config_path)
 
 
 def get_fusion_config_manager(
@@ -273,9 +341,9 @@ def get_fusion_config_manager(
     Returns:
         FusionConfigManager instance
     """
-    global _config_manager
+    global _config_path
 
-    if _config_manager is None:
-        _config_manager = FusionConfigManager(config_path)
+    if _config_path is None:
+        _config_path = config_path
 
-    return _config_manager
+    return _build_config_manager()
@@ -0,0 +1,56 @@
+"""Logging configuration with an orjson-backed structured formatter."""
+
+import logging
+from datetime import datetime, timezone
+
+import orjson
+
+# Attributes every LogRecord carries; anything else came in via ``extra=``
+_RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", (), None))
+) | {"message", "asctime"}
+
+_TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class JSONLogFormatter(logging.Formatter):
+    """Render log records as one JSON object per line, including ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+
+        return orjson.dumps(payload, default=str).decode()
+
+
+def configure_logging(debug: bool = False) -> None:
+    """
+    Configure root logging for the application.
+
+    Debug mode keeps the human-readable text format; otherwise records are
+    emitted as JSON so request metadata passed via ``extra=`` is preserved.
+
+    Args:
+        debug: Whether the application runs in debug mode
+    """
+    handler = logging.StreamHandler()
+    if debug:
+        handler.setFormatter(logging.Formatter(_TEXT_FORMAT))
+    else:
+        handler.setFormatter(JSONLogFormatter())
+
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.INFO,
+        handlers=[handler],
+    )
@@ -1,10 +1,15 @@
 """Metrics storage and retrieval using Redis and Prometheus."""
 
 import logging
-import json
+import time
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 from datetime import datetime
-from typing import List, Optional
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+import numpy as np
+import orjson
 import redis
 from redis.exceptions import RedisError
 from prometheus_client import Counter, Histogram
@@ -22,19 +27,58 @@ telemetry_events_total = Counter(
 )
 
 telemetry_processing_time = Histogram(
-    "telemetry_event_processing_seconds", "Time to process telemetry event"
+    "telemetry_event_processing_seconds",
+    "Time to process telemetry event",
+    # Single-event flushes are sub-second; skip the default 5s/10s buckets
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
 )
 
 telemetry_batch_size = Histogram(
-    "telemetry_batch_size", "Number of events in telemetry batches"
+    "telemetry_batch_size",
+    "Number of events in telemetry batches",
+    # Event counts up to the 1000-event batch limit, not latency buckets
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
 )
 
 telemetry_duplicates_total = Counter(
     "telemetry_duplicates_total", "Total duplicate telemetry events detected"
 )
 
+# Bound telemetry_events_total children, keyed by (event_type, status)
+_telemetry_event_counters: Dict[Tuple[str, str], Counter] = {}
 
-@dataclass
+
+def telemetry_event_counter(event_type: str, status: str) -> Counter:
+    """
+    Get the telemetry_events_total child for an (event_type, status) pair.
+
+    The bound child is created on first use and reused afterwards, so
+    increments skip prometheus_client's label validation and lookup.
+
+    Args:
+        event_type: Telemetry event type
+        status: Processing status ("success" or "failure")
+
+    Returns:
+        Labeled counter ready for inc()
+    """
+    key = (event_type, status)
+    counter = _telemetry_event_counters.get(key)
+    if counter is None:
+        counter = telemetry_events_total.labels(event_type=event_type, status=status)
+        _telemetry_event_counters[key] = counter
+    return counter
+
+
+# Add a batch of (score, member) pairs and trim to the newest 10,000 entries
+# atomically, in one round-trip. ARGV is flattened score1, member1, ...
+_RECORD_METRICS_LUA = """
+redis.call('ZADD', KEYS[1], unpack(ARGV))
+redis.call('ZREMRANGEBYRANK', KEYS[1], 0, -10001)
+"""
+
+
+@dataclass(slots=True)
 class InferenceMetrics:
     """Inference performance metrics."""
 
@@ -49,31 +93,51 @@ class InferenceMetrics:
 class MetricsStore:
     """Redis-backed metrics storage with fallback to in-memory."""
 
-    def __init__(self, redis_url: Optional[str] = None, max_memory_size: int = 1000):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        max_memory_size: int = 1000,
+        flush_threshold: int = 32,
+        flush_interval_seconds: float = 1.0,
+    ):
         """
         Initialize metrics store.
 
         Args:
             redis_url: Redis connection URL (e.g., redis://localhost:6379/0)
             max_memory_size: Maximum number of metrics to keep in memory fallback
+            flush_threshold: Number of buffered metrics that triggers a Redis flush
+            flush_interval_seconds: Seconds since the last flush after which the
+                next record or read flushes the buffer (checked only then, so
+                not a hard maximum age)
         """
         self.redis_url = redis_url
         self.max_memory_size = max_memory_size
+        self.flush_threshold = flush_threshold
+        self.flush_interval_seconds = flush_interval_seconds
         self.redis_client: Optional[redis.Redis] = None
-        self.memory_fallback: List[InferenceMetrics] = []
+        self.memory_fallback: Deque[InferenceMetrics] = deque(maxlen=max_memory_size)
         self.use_redis = False
 
+        # Pending (metrics, score) pairs written to Redis in one script call
+        self._redis_buffer: List[Tuple[InferenceMetrics, float]] = []
+        self._record_script = None
+        self._last_flush = time.monotonic()
+
         # Try to connect to Redis
         if redis_url:
             try:
                 self.redis_client = redis.from_url(
                     redis_url,
-                    decode_responses=True,
                     socket_timeout=2,
                     socket_connect_timeout=2,
                 )
                 # Test connection
                 self.redis_client.ping()
+                # Sent once, then invoked by SHA1 via EVALSHA
+                self._record_script = self.redis_client.register_script(
+                    _RECORD_METRICS_LUA
+                )
                 self.use_redis = True
                 logger.info("Connected to Redis for metrics storage")
             except (RedisError, Exception) as e:
@@ -81,6 +145,7 @@ class MetricsStore:
                     f"Failed to connect to Redis: {e}. Using in-memory fallback."
                 )
                 self.redis_client = None
+                self._record_script = None
                 self.use_redis = False
         else:
             logger.info("No Redis URL provided. Using in-memory metrics storage.")
@@ -103,49 +168,68 @@ class MetricsStore:
             success: Whether inference succeeded
             error_message: Optional error message if failed
         """
+        now = time.time()
         metrics = InferenceMetrics(
             student_id=student_id,
             skill_type=skill_type,
             inference_time_ms=inference_time_ms,
             success=success,
             error_message=error_message,
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=datetime.utcfromtimestamp(now).isoformat(),
         )
 
         if self.use_redis and self.redis_client:
-            try:
-                self._record_to_redis(metrics)
-            except (RedisError, Exception) as e:
-                logger.error(
-                    f"Failed to record metrics to Redis: {e}. Using memory fallback."
-                )
-                self._record_to_memory(metrics)
+            # A failed flush moves the whole buffer to the memory fallback
+            self._record_to_redis(metrics, score=now)
         else:
             self._record_to_memory(metrics)
 
-    def _record_to_redis(self, metrics: InferenceMetrics):
-        """Record metrics to Redis using a sorted set."""
+    def _record_to_redis(self, metrics: InferenceMetrics, score: float):
+        """Buffer metrics for Redis, flushing when the batch is full or stale."""
         if not self.redis_client:
             return
 
-        # Use sorted set with timestamp as score for time-based queries
-        key = "inference_metrics"
-        value = json.dumps(asdict(metrics))
-        score = datetime.fromisoformat(metrics.timestamp).timestamp()
+        # Use sorted set with epoch timestamp as score for time-based queries
+        self._redis_buffer.append((metrics, score))
+
+        if (
+            len(self._redis_buffer) >= self.flush_threshold
+            or time.monotonic() - self._last_flush >= self.flush_interval_seconds
+        ):
+            self.flush()
 
-        self.redis_client.zadd(key, {value: score})
+    def flush(self):
+        """
+        Write buffered metrics to Redis in a single atomic script call.
+
+        If the write fails, every buffered metric is kept in the memory
+        fallback instead of being dropped.
+        """
+        self._last_flush = time.monotonic()
+        if not self._record_script or not self._redis_buffer:
+            return
 
-        # Keep only last 10,000 metrics (configurable)
-        self.redis_client.zremrangebyrank(key, 0, -10001)
+        # Swap the buffer out first so a failed flush is not retried forever
+        pending, self._redis_buffer = self._redis_buffer, []
+
+        args = []
+        for metrics, score in pending:
+            args.append(score)
+            args.append(orjson.dumps(metrics))
+        try:
+            self._record_script(keys=["inference_metrics"], args=args)
+        except (RedisError, Exception) as e:
+            logger.error(
+                f"Failed to record {len(pending)} metrics to Redis: {e}. "
+                "Using memory fallback."
+            )
+            for metrics, _ in pending:
+                self._record_to_memory(metrics)
 
     def _record_to_memory(self, metrics: InferenceMetrics):
-        """Record metrics to in-memory list."""
+        """Record metrics to in-memory deque (oldest evicted past maxlen)."""
         self.memory_fallback.append(metrics)
 
-        # Keep only last N metrics
-        if len(self.memory_fallback) > self.max_memory_size:
-            self.memory_fallback.pop(0)
-
     def get_recent_metrics(self, limit: int = 100) -> List[InferenceMetrics]:
         """
         Get recent metrics.
@@ -158,6 +242,7 @@ class MetricsStore:
         """
         if self.use_redis and self.redis_client:
             try:
+                self.flush()
                 return self._get_from_redis(limit)
             except (RedisError, Exception) as e:
                 logger.error(
@@ -175,13 +260,23 @@ class MetricsStore:
         key = "inference_metrics"
         # Get most recent entries (highest scores)
         results = self.redis_client.zrevrange(key, 0, limit - 1)
+        if not results:
+            return []
+
+        # Decode every entry with a single parser call by joining them into
+        # one JSON array; fall back to per-entry parsing if any are corrupt
+        try:
+            items = orjson.loads(b"[" + b",".join(results) + b"]")
+            return [InferenceMetrics(**data) for data in items]
+        except (orjson.JSONDecodeError, TypeError):
+            pass
 
         metrics = []
         for result in results:
             try:
-                data = json.loads(result)
+                data = orjson.loads(result)
                 metrics.append(InferenceMetrics(**data))
-            except (json.JSONDecodeError, TypeError) as e:
+            except (orjson.JSONDecodeError, TypeError) as e:
                 logger.warning(f"Failed to parse metric: {e}")
                 continue
 
@@ -189,7 +284,7 @@ class MetricsStore:
 
     def _get_from_memory(self, limit: int) -> List[InferenceMetrics]:
         """Get metrics from memory."""
-        return list(reversed(self.memory_fallback[-limit:]))
+        return list(islice(reversed(self.memory_fallback), limit))
 
     def get_metrics_summary(self) -> dict:
         """
@@ -213,21 +308,20 @@ class MetricsStore:
             }
 
         total = len(metrics)
-        successful = sum(1 for m in metrics if m.success)
+        success_mask = np.fromiter(
+            (m.success for m in metrics), dtype=bool, count=total
+        )
+        successful = int(success_mask.sum())
         failed = total - successful
 
-        times = [m.inference_time_ms for m in metrics if m.success]
-        if times:
-            avg_time = sum(times) / len(times)
-            max_time = max(times)
-            min_time = min(times)
-
-            # Calculate P95
-            sorted_times = sorted(times)
-            p95_index = int(len(sorted_times) * 0.95)
-            p95_time = (
-                sorted_times[p95_index] if p95_index < len(sorted_times) else max_time
-            )
+        times = np.fromiter(
+            (m.inference_time_ms for m in metrics), dtype=np.float64, count=total
+        )[success_mask]
+        if times.size:
+            avg_time = float(times.mean())
+            max_time = float(times.max())
+            min_time = float(times.min())
+            p95_time = float(np.percentile(times, 95))
         else:
             avg_time = max_time = min_time = p95_time = 0.0
 
@@ -244,6 +338,7 @@ class MetricsStore:
 
     def clear_metrics(self):
         """Clear all metrics (use with caution)."""
+        self._redis_buffer.clear()
         if self.use_redis and self.redis_client:
             try:
                 self.redis_client.delete("inference_metrics")
@@ -255,8 +350,14 @@ class MetricsStore:
         logger.info("Cleared in-memory metrics")
 
 
-# Global metrics store instance
-_metrics_store: Optional[MetricsStore] = None
+# Redis URL captured from the first get_metrics_store call
+_redis_url: Optional[str] = None
+
+
+@lru_cache(maxsize=1)
+def _build_metrics_store() -> MetricsStore:
+    """Create the global metrics store (cached after first call)."""
+    return MetricsStore(redis_url=_redis_url)
 
 
 def get_metrics_store(redis_url: Optional[str] = None) -> MetricsStore:
@@ -264,14 +365,14 @@ def get_metrics_store(redis_url: Optional[str] = None) -> MetricsStore:
     Get or create global metrics store.
 
     Args:
-        redis_url: Redis connection URL
+        redis_url: Redis connection URL (only used on first call)
 
     Returns:
         MetricsStore instance
     """
-    global _metrics_store
+    global _redis_url
 
-    if _metrics_store is None:
-        _metrics_store = MetricsStore(redis_url=redis_url)
+    if _redis_url is None:
+        _redis_url = redis_url
 
-    return _metrics_store
+    return _build_metrics_store()
@@ -1,6 +1,5 @@
 """Rate limiting utilities for API calls."""
 
-import asyncio
 import time
 import logging
 from typing import Dict, Optional
@@ -10,7 +9,7 @@ from functools import wraps
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitConfig:
     """Configuration for rate limiting."""
 
@@ -32,9 +31,11 @@ class RateLimiter:
         self.config = config
         self.minute_tokens = config.calls_per_minute
         self.hour_tokens = config.calls_per_hour
-        self.last_minute_refill = time.time()
-        self.last_hour_refill = time.time()
-        self.lock = asyncio.Lock()
+        # Refill rates in tokens per second, so refilling is a single multiply
+        self._per_minute_rate = config.calls_per_minute / 60.0
+        self._per_hour_rate = config.calls_per_hour / 3600.0
+        # Monotonic so wall-clock (NTP) adjustments can't skew refills
+        self.last_refill = time.monotonic()
 
     async def acquire(self, resource_name: str = "default") -> bool:
         """
@@ -49,67 +50,58 @@ class RateLimiter:
         Raises:
             RuntimeError: If rate limit is exceeded
         """
-        async with self.lock:
-            current_time = time.time()
-
-            # Refill minute bucket
-            time_since_minute = current_time - self.last_minute_refill
-            if time_since_minute >= 60:
-                self.minute_tokens = self.config.calls_per_minute
-                self.last_minute_refill = current_time
-            elif time_since_minute > 0:
-                # Gradual refill based on time elapsed
-                refill_amount = (time_since_minute / 60) * self.config.calls_per_minute
-                self.minute_tokens = min(
-                    self.config.calls_per_minute, self.minute_tokens + refill_amount
-                )
-
-            # Refill hour bucket
-            time_since_hour = current_time - self.last_hour_refill
-            if time_since_hour >= 3600:
-                self.hour_tokens = self.config.calls_per_hour
-                self.last_hour_refill = current_time
-            elif time_since_hour > 0:
-                # Gradual refill based on time elapsed
-                refill_amount = (time_since_hour / 3600) * self.config.calls_per_hour
-                self.hour_tokens = min(
-                    self.config.calls_per_hour, self.hour_tokens + refill_amount
-                )
+        # No await happens below, so the refill/check/consume sequence runs
+        # atomically on the event loop without needing an asyncio.Lock
+        current_time = time.monotonic()
+        elapsed = current_time - self.last_refill
+        self.last_refill = current_time
+
+        # Refill both buckets based on time elapsed since the last call
+        self.minute_tokens = min(
+            self.config.calls_per_minute,
+            self.minute_tokens + elapsed * self._per_minute_rate,
+        )
+        self.hour_tokens = min(
+            self.config.calls_per_hour,
+            self.hour_tokens + elapsed * self._per_hour_rate,
+        )
 
-            # Check if we have tokens available
-            if self.minute_tokens < 1:
-                wait_time = 60 - time_since_minute
-                logger.warning(
-                    f"Rate limit exceeded for {resource_name}: "
-                    f"per-minute limit reached. Wait {wait_time:.1f}s"
-                )
-                raise RuntimeError(
-                    f"Rate limit exceeded: {self.config.calls_per_minute} calls/minute. "
-                    f"Retry after {wait_time:.1f} seconds"
-                )
+        # Check if we have tokens available
+        if self.minute_tokens < 1:
+            wait_time = (1 - self.minute_tokens) / self._per_minute_rate
+            logger.warning(
+                f"Rate limit exceeded for {resource_name}: "
+                f"per-minute limit reached. Wait {wait_time:.1f}s"
+            )
+            raise RuntimeError(
+                f"Rate limit exceeded: {self.config.calls_per_minute} calls/minute. "
+                f"Retry after {wait_time:.1f} seconds"
+            )
 
-            if self.hour_tokens < 1:
-                wait_time = 3600 - time_since_hour
-                logger.warning(
-                    f"Rate limit exceeded for {resource_name}: "
-                    f"per-hour limit reached. Wait {wait_time:.1f}s"
-                )
-                raise RuntimeError(
-                    f"Rate limit exceeded: {self.config.calls_per_hour} calls/hour. "
-                    f"Retry after {wait_time:.1f} seconds"
-                )
+        if self.hour_tokens < 1:
+            wait_time = (1 - self.hour_tokens) / self._per_hour_rate
+            logger.warning(
+                f"Rate limit exceeded for {resource_name}: "
+                f"per-hour limit reached. Wait {wait_time:.1f}s"
+            )
+            raise RuntimeError(
+                f"Rate limit exceeded: {self.config.calls_per_hour} calls/hour. "
+                f"Retry after {wait_time:.1f} seconds"
+            )
 
-            # Consume tokens
-            self.minute_tokens -= 1
-            self.hour_tokens -= 1
+        # Consume tokens
+        self.minute_tokens -= 1
+        self.hour_tokens -= 1
 
-            logger.debug(
-                f"Rate limiter for {resource_name}: "
-                f"minute_tokens={self.minute_tokens:.1f}, "
-                f"hour_tokens={self.hour_tokens:.1f}"
-            )
+        # Lazy %-formatting: the message is only built if DEBUG is enabled
+        logger.debug(
+            "Rate limiter for %s: minute_tokens=%.1f, hour_tokens=%.1f",
+            resource_name,
+            self.minute_tokens,
+            self.hour_tokens,
+        )
 
-            return True
+        return True
 
 
 class RateLimiterRegistry:
@@ -118,7 +110,6 @@ class RateLimiterRegistry:
     def __init__(self):
         """Initialize rate limiter registry."""
         self._limiters: Dict[str, RateLimiter] = {}
-        self._configs: Dict[str, RateLimitConfig] = {}
 
     def register(self, name: str, config: RateLimitConfig):
         """
@@ -129,7 +120,6 @@ class RateLimiterRegistry:
             config: Rate limit configuration
         """
         self._limiters[name] = RateLimiter(config)
-        self._configs[name] = config
         logger.info(
             f"Registered rate limiter '{name}': "
             f"{config.calls_per_minute} calls/min, {config.calls_per_hour} calls/hour"
@@ -157,7 +147,8 @@ class RateLimiterRegistry:
         Returns:
             RateLimitConfig or None if not found
         """
-        return self._configs.get(name)
+        limiter = self._limiters.get(name)
+        return limiter.config if limiter else None
 
 
 # Global registry
@@ -190,8 +181,9 @@ def rate_limit(limiter_name: str):
 
             if limiter is None:
                 logger.warning(
-                    f"Rate limiter '{limiter_name}' not registered, "
-                    "proceeding without rate limiting"
+                    "Rate limiter '%s' not registered, "
+                    "proceeding without rate limiting",
+                    limiter_name,
                 )
                 return await func(*args, **kwargs)
 
@@ -1,16 +1,39 @@
 """Role-Based Access Control (RBAC) implementation."""
 
+import hashlib
+import logging
 from enum import Enum
-from typing import List, Optional
-from functools import wraps
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+)
+from functools import lru_cache
 from fastapi import HTTPException, status, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import exists, select
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 
 from app.models.user import User
-from app.api.endpoints.auth import get_current_user
+from app.api.endpoints.auth import TokenData, get_current_user
+from app.core.config import settings
 from app.core.database import get_db
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Short TTL bounds how long a revoked relationship can keep granting access
+ACCESS_CACHE_TTL_SECONDS = 30
+ACCESS_CACHE_PREFIX = "rbac"
+
 
 class Role(str, Enum):
     """User roles in the system."""
@@ -105,6 +128,30 @@ ROLE_PERMISSIONS = {
     ],
 }
 
+# Permission sets keyed by raw role string, so checks need no Role(...) coercion
+_ROLE_PERMS_FROZEN: Dict[str, FrozenSet[Permission]] = {
+    role.value: frozenset(perms) for role, perms in ROLE_PERMISSIONS.items()
+}
+
+# Fields stripped from researcher exports; "id" is replaced by anonymous_id
+_PII_FIELDS: FrozenSet[str] = frozenset(
+    (
+        "name",
+        "email",
+        "phone",
+        "address",
+        "date_of_birth",
+        "student_id",
+        "parent_name",
+        "parent_email",
+        "parent_phone",
+        "id",
+    )
+)
+
+# Fresh hasher cloned per record instead of constructing a new one
+_SHA256_PROTO = hashlib.sha256()
+
 
 def has_permission(user: User, permission: Permission) -> bool:
     """
@@ -120,79 +167,124 @@ def has_permission(user: User, permission: Permission) -> bool:
     if not user or not user.role:
         return False
 
-    user_permissions = ROLE_PERMISSIONS.get(Role(user.role), [])
-    return permission in user_permissions
+    return _has_permission_cached(user.role, permission.value)
+
+
+@lru_cache(maxsize=256)
+def _has_permission_cached(role: str, permission: str) -> bool:
+    """Memoized (role, permission) check; the key space is a few hundred entries."""
+    return permission in _ROLE_PERMS_FROZEN.get(role, frozenset())
 
 
 def require_permission(permission: Permission):
     """
-    Decorator to require a specific permission for an endpoint.
+    Dependency factory requiring a specific permission for an endpoint.
 
     Usage:
         @router.get("/protected")
-        @require_permission(Permission.ASSESSMENTS_READ_ALL)
-        async def protected_endpoint(current_user: User = Depends(get_current_user)):
+        async def protected_endpoint(
+            current_user: TokenData = Depends(
+                require_permission(Permission.ASSESSMENTS_READ_ALL)
+            ),
+        ):
             ...
     """
 
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # Get current user from kwargs (injected by Depends)
-            current_user = kwargs.get("current_user")
-
-            if not current_user:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Authentication required",
-                )
-
-            if not has_permission(current_user, permission):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Permission denied: {permission.value} required",
-                )
+    async def _require_permission(
+        current_user: TokenData = Depends(get_current_user),
+    ) -> TokenData:
+        if not has_permission(current_user, permission):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Permission denied: {permission.value} required",
+            )
+        return current_user
 
-            return await func(*args, **kwargs)
-
-        return wrapper
-
-    return decorator
+    return _require_permission
 
 
 def require_role(*allowed_roles: Role):
     """
-    Decorator to require specific role(s) for an endpoint.
+    Dependency factory requiring specific role(s) for an endpoint.
 
     Usage:
         @router.get("/admin")
-        @require_role(Role.SYSTEM_ADMIN, Role.SCHOOL_ADMIN)
-        async def admin_endpoint(current_user: User = Depends(get_current_user)):
+        async def admin_endpoint(
+            current_user: TokenData = Depends(
+                require_role(Role.SYSTEM_ADMIN, Role.SCHOOL_ADMIN)
+            ),
+        ):
             ...
     """
+    allowed = frozenset(r.value for r in allowed_roles)
+
+    async def _require_role(
+        current_user: TokenData = Depends(get_current_user),
+    ) -> TokenData:
+        if current_user.role not in allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Access denied. Requires one of: {[r.value for r in allowed_roles]}",
+            )
+        return current_user
+
+    return _require_role
+
+
+_SYSTEM_ADMIN = Role.SYSTEM_ADMIN.value
+_STUDENT = Role.STUDENT.value
+_RESEARCHER = Role.RESEARCHER.value
+
 
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            current_user = kwargs.get("current_user")
+def _access_key(user: User, student_id: str) -> str:
+    # Role and school are part of the key so a change to either never serves
+    # a decision made under the old ones
+    return f"{ACCESS_CACHE_PREFIX}:{user.id}:{user.role}:{user.school_id}:{student_id}"
 
-            if not current_user:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Authentication required",
-                )
 
-            if Role(current_user.role) not in allowed_roles:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Access denied. Requires one of: {[r.value for r in allowed_roles]}",
-                )
+def _fast_check(user: User, student_id: str) -> Optional[bool]:
+    """Decide access for roles that need no database lookup, else return None."""
+    role = user.role
+    # System admin can access all
+    if role == _SYSTEM_ADMIN:
+        return True
+    # Student can only access own data (assuming user has student_id field)
+    if role == _STUDENT:
+        return getattr(user, "student_id", None) == student_id
+    # Researcher cannot access individual student data
+    if role == _RESEARCHER:
+        return False
+    return None
+
+
+async def _access_parent(user: User, student_id: str, db: AsyncSession) -> bool:
+    # Parent can access own child's data; is_parent_of denies without a
+    # query until a parent relation exists, so there is nothing to cache
+    return await is_parent_of(user.id, student_id, db)
 
-            return await func(*args, **kwargs)
 
-        return wrapper
+async def _access_teacher(user: User, student_id: str, db: AsyncSession) -> bool:
+    # Teacher can access students in their classes
+    return await _cached_access(
+        _access_key(user, student_id),
+        lambda: is_in_teacher_class(user.id, student_id, db),
+    )
+
+
+async def _access_school(user: User, student_id: str, db: AsyncSession) -> bool:
+    # School admin can access students in their school
+    return await _cached_access(
+        _access_key(user, student_id),
+        lambda: is_in_school(user.school_id, student_id, db),
+    )
+
 
-    return decorator
+# Role string -> relationship check for roles that need the database
+_ACCESS_DISPATCH: Dict[str, Callable[[User, str, AsyncSession], Awaitable[bool]]] = {
+    Role.PARENT.value: _access_parent,
+    Role.TEACHER.value: _access_teacher,
+    Role.SCHOOL_ADMIN.value: _access_school,
+}
 
 
 async def can_access_student(user: User, student_id: str, db: AsyncSession) -> bool:
@@ -207,82 +299,112 @@ async def can_access_student(user: User, student_id: str, db: AsyncSession) -> b
     Returns:
         True if access allowed, False otherwise
     """
-    # System admin can access all
-    if user.role == Role.SYSTEM_ADMIN.value:
-        return True
+    # No-DB roles are answered without ever suspending the coroutine
+    allowed = _fast_check(user, student_id)
+    if allowed is not None:
+        return allowed
+
+    check = _ACCESS_DISPATCH.get(user.role)
+    if check is None:
+        # Unknown roles get no access
+        return False
+    return await check(user, student_id, db)
 
-    # Student can only access own data
-    if user.role == Role.STUDENT.value:
-        # Assuming user has student_id field
-        return getattr(user, "student_id", None) == student_id
 
-    # Parent can access own child's data
-    if user.role == Role.PARENT.value:
-        # Check parent-child relationship in database
-        return await is_parent_of(user.id, student_id, db)
+@lru_cache(maxsize=1)
+def _get_access_cache() -> "aioredis.Redis":
+    """Shared async Redis client for cached access decisions."""
+    return aioredis.from_url(
+        settings.REDIS_URL, max_connections=settings.REDIS_MAX_CONNECTIONS
+    )
 
-    # Teacher can access students in their classes
-    if user.role == Role.TEACHER.value:
-        return await is_in_teacher_class(user.id, student_id, db)
 
-    # School admin can access students in their school
-    if user.role == Role.SCHOOL_ADMIN.value:
-        return await is_in_school(user.school_id, student_id, db)
+async def _cached_access(key: str, check: Callable[[], Awaitable[bool]]) -> bool:
+    """
+    Resolve an access decision through Redis, falling back to the database.
 
-    # Researcher cannot access individual student data
-    if user.role == Role.RESEARCHER.value:
-        return False
+    Args:
+        key: Cache key, ``rbac:{user_id}:{role}:{school_id}:{student_id}``
+        check: Zero-argument callable returning the relationship-check coroutine
+
+    Returns:
+        Cached or freshly computed access decision
+    """
+    cache = _get_access_cache()
+    try:
+        cached = await cache.get(key)
+    except RedisError as e:
+        logger.warning("Access cache read failed: %s", e)
+        return await check()
+
+    if cached is not None:
+        return cached == b"1"
+
+    allowed = await check()
+    try:
+        await cache.set(key, b"1" if allowed else b"0", ex=ACCESS_CACHE_TTL_SECONDS)
+    except RedisError as e:
+        logger.warning("Access cache write failed: %s", e)
+    return allowed
 
-    return False
+
+async def invalidate_access_cache(user_id: str) -> None:
+    """
+    Drop cached access decisions for a user.
+
+    Call after parent, teacher/class or school membership changes so the
+    user does not keep stale access until the TTL expires.
+    """
+    cache = _get_access_cache()
+    try:
+        keys = [
+            key
+            async for key in cache.scan_iter(
+                match=f"{ACCESS_CACHE_PREFIX}:{user_id}:*", count=500
+            )
+        ]
+        if keys:
+            await cache.unlink(*keys)
+    except RedisError as e:
+        logger.warning("Access cache invalidation failed for %s: %s", user_id, e)
 
 
 async def is_parent_of(parent_id: str, student_id: str, db: AsyncSession) -> bool:
     """Check if user is parent of student."""
-    # This would query parent-student relationship table
-    # For now, placeholder implementation
-    from app.models.student import Student
-
-    stmt = select(Student).where(
-        Student.id == student_id, Student.parent_id == parent_id
-    )
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none() is not None
+    # The schema has no parent-student relation yet (Student has no parent_id
+    # and there is no link table), so parents are denied until one exists
+    return False
 
 
 async def is_in_teacher_class(
     teacher_id: str, student_id: str, db: AsyncSession
 ) -> bool:
-    """Check if student is in teacher's class."""
-    # This would query class enrollment
-    # For now, placeholder implementation
-    from app.models.student import Student
-    from app.models.teacher import Teacher
-
-    # Get teacher's classes
-    stmt = select(Teacher).where(Teacher.user_id == teacher_id)
-    result = await db.execute(stmt)
-    teacher = result.scalar_one_or_none()
-
-    if not teacher:
-        return False
-
-    # Check if student is in any of teacher's classes
-    stmt = select(Student).where(
-        Student.id == student_id, Student.class_id.in_(teacher.class_ids or [])
+    """Check if student is assigned to the teacher (via teacher_student)."""
+    from app.models.teacher import Teacher, teacher_student_association
+
+    # One EXISTS over teachers joined to the link table; the student side is
+    # answered by idx_teacher_student_student_teacher
+    link = teacher_student_association.c
+    stmt = select(
+        exists().where(
+            Teacher.user_id == teacher_id,
+            link.teacher_id == Teacher.id,
+            link.student_id == student_id,
+        )
     )
     result = await db.execute(stmt)
-    return result.scalar_one_or_none() is not None
+    return bool(result.scalar())
 
 
 async def is_in_school(school_id: str, student_id: str, db: AsyncSession) -> bool:
     """Check if student is in school."""
     from app.models.student import Student
 
-    stmt = select(Student).where(
-        Student.id == student_id, Student.school_id == school_id
+    stmt = select(
+        exists().where(Student.id == student_id, Student.school_id == school_id)
     )
     result = await db.execute(stmt)
-    return result.scalar_one_or_none() is not None
+    return bool(result.scalar())
 
 
 async def filter_accessible_students(
@@ -299,13 +421,46 @@ async def filter_accessible_students(
     Returns:
         Filtered list of accessible student IDs
     """
-    accessible = []
+    if not student_ids:
+        return []
 
-    for student_id in student_ids:
-        if await can_access_student(user, student_id, db):
-            accessible.append(student_id)
+    # System admin can access all
+    if user.role == Role.SYSTEM_ADMIN.value:
+        return list(student_ids)
 
-    return accessible
+    # Student can only access own data; no query needed
+    if user.role == Role.STUDENT.value:
+        own_id = getattr(user, "student_id", None)
+        return [sid for sid in student_ids if sid == own_id]
+
+    from app.models.student import Student
+
+    # One IN query per call, scoped by the same predicates as can_access_student
+    if user.role == Role.PARENT.value:
+        # No parent-student relation exists yet; see is_parent_of
+        return []
+    elif user.role == Role.TEACHER.value:
+        from app.models.teacher import Teacher, teacher_student_association
+
+        # Correlated against the outer students row; no separate teacher fetch
+        link = teacher_student_association.c
+        scope = exists().where(
+            Teacher.user_id == user.id,
+            link.teacher_id == Teacher.id,
+            link.student_id == Student.id,
+        )
+    elif user.role == Role.SCHOOL_ADMIN.value:
+        scope = Student.school_id == user.school_id
+    else:
+        # Researchers (and unknown roles) cannot access individual student data
+        return []
+
+    stmt = select(Student.id).where(Student.id.in_(student_ids), scope)
+    result = await db.execute(stmt)
+    allowed = set(result.scalars().all())
+
+    # Preserve caller ordering
+    return [sid for sid in student_ids if sid in allowed]
 
 
 def anonymize_student_data(data: dict) -> dict:
@@ -318,31 +473,58 @@ def anonymize_student_data(data: dict) -> dict:
     Returns:
         Anonymized data dictionary
     """
-    anonymized = data.copy()
+    anonymized = {k: v for k, v in data.items() if k not in _PII_FIELDS}
 
-    # Remove PII fields
-    pii_fields = [
-        "name",
-        "email",
-        "phone",
-        "address",
-        "date_of_birth",
-        "student_id",
-        "parent_name",
-        "parent_email",
-        "parent_phone",
-    ]
+    # Replace ID with anonymous hash
+    if "id" in data:
+        h = _SHA256_PROTO.copy()
+        h.update(data["id"].encode())
+        anonymized["anonymous_id"] = h.hexdigest()[:16]
 
-    for field in pii_fields:
-        anonymized.pop(field, None)
+    return anonymized
 
-    # Replace ID with anonymous hash
-    if "id" in anonymized:
-        import hashlib
 
-        anonymized["anonymous_id"] = hashlib.sha256(
-            anonymized["id"].encode()
-        ).hexdigest()[:16]
-        anonymized.pop("id")
+def anonymize_batch(rows: Iterable[dict]) -> List[dict]:
+    """
+    Remove PII from many student records (bulk researcher exports).
+
+    Args:
+        rows: Student data dictionaries
 
+    Returns:
+        Anonymized data dictionaries, in input order
+    """
+    out = []
+    for data in rows:
+        anonymized = {k: v for k, v in data.items() if k not in _PII_FIELDS}
+        if "id" in data:
+            h = _SHA256_PROTO.copy()
+            h.update(data["id"].encode())
+            anonymized["anonymous_id"] = h.hexdigest()[:16]
+        out.append(anonymized)
+    return out
+
+
+def anonymize_dataframe(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Remove PII from a column-oriented student export.
+
+    Drops PII columns in one operation and hashes the ``id`` column into
+    ``anonymous_id``, matching :func:`anonymize_student_data` per row. Each
+    distinct id is hashed once and the column is filled with one ``map``.
+
+    Args:
+        df: Student data, one row per student
+
+    Returns:
+        Anonymized DataFrame (the input is not modified)
+    """
+    anonymized = df.drop(columns=[c for c in df.columns if c in _PII_FIELDS])
+    if "id" in df.columns:
+        digests = {}
+        for sid in df["id"].unique():
+            h = _SHA256_PROTO.copy()
+            h.update(sid.encode())
+            digests[sid] = h.hexdigest()[:16]
+        anonymized["anonymous_id"] = df["id"].map(digests)
     return anonymized
@@ -2,7 +2,8 @@
 
 import os
 import logging
-from typing import Optional, Dict
+import threading
+from typing import Dict, Optional, Set, Tuple
 from functools import lru_cache
 
 logger = logging.getLogger(__name__)
@@ -53,8 +54,13 @@ class SecretManager:
             self.client = None
             logger.info("Using environment variables for secrets")
 
-        # Cache for secrets to avoid repeated API calls
-        self._cache: Dict[str, str] = {}
+        # Resolved (secret_name, env_var_name) lookups
+        self._cache: Dict[Tuple[str, str], str] = {}
+        # Keys found in neither source; only the environment is rechecked
+        self._misses: Set[Tuple[str, str]] = set()
+        # One load lock per key, so cold lookups of different secrets overlap
+        self._load_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._load_locks_guard = threading.Lock()
 
     def _get_secret_from_gcp(
         self, secret_name: str, version: str = "latest"
@@ -102,7 +108,7 @@ class SecretManager:
         Get secret from GCP Secret Manager or environment variable.
 
         Lookup order:
-        1. Check cache
+        1. Check cache (keyed by secret_name and env_var_name)
         2. Try GCP Secret Manager (if enabled)
         3. Try environment variable
         4. Return default value
@@ -123,22 +129,21 @@ class SecretManager:
         if env_var_name is None:
             env_var_name = secret_name.upper()
 
-        # Check cache first
-        cache_key = f"{secret_name}:{env_var_name}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        secret_value = None
-
-        # Try GCP Secret Manager
-        if self.use_gcp:
-            secret_value = self._get_secret_from_gcp(secret_name)
-
-        # Fall back to environment variable
-        if secret_value is None:
+        key = (secret_name, env_var_name)
+        secret_value = self._cache.get(key)
+        if secret_value is None and key in self._misses:
+            # Already missing from GCP; the variable may have been set since
             secret_value = os.getenv(env_var_name)
-            if secret_value:
-                logger.debug(f"Using environment variable '{env_var_name}' for secret")
+        elif secret_value is None:
+            # Double-checked so concurrent first reads make one GCP call
+            with self._load_lock(key):
+                secret_value = self._cache.get(key)
+                if secret_value is None and key not in self._misses:
+                    secret_value = self._lookup(secret_name, env_var_name)
+                    if secret_value is not None:
+                        self._cache[key] = secret_value
+                    else:
+                        self._misses.add(key)
 
         # Use default if still not found
         if secret_value is None:
@@ -151,15 +156,34 @@ class SecretManager:
                 f"or environment variable '{env_var_name}'"
             )
 
-        # Cache the result
-        if secret_value is not None:
-            self._cache[cache_key] = secret_value
+        return secret_value
+
+    def _load_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        """Return the lock serializing loads of one (secret, env var) key."""
+        with self._load_locks_guard:
+            return self._load_locks.setdefault(key, threading.Lock())
+
+    def _lookup(self, secret_name: str, env_var_name: str) -> Optional[str]:
+        """Resolve a secret from GCP, then the environment (uncached)."""
+        secret_value = None
+
+        # Try GCP Secret Manager
+        if self.use_gcp:
+            secret_value = self._get_secret_from_gcp(secret_name)
+
+        # Fall back to environment variable
+        if secret_value is None:
+            secret_value = os.getenv(env_var_name)
+            if secret_value:
+                logger.debug(f"Using environment variable '{env_var_name}' for secret")
 
         return secret_value
 
     def clear_cache(self):
         """Clear the secrets cache."""
-        self._cache.clear()
+        with self._load_locks_guard:
+            self._cache.clear()
+            self._misses.clear()
         logger.info("Cleared secrets cache")
 
 
@@ -1,10 +1,10 @@
 """Main FastAPI application entry point."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import logging
 
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -12,9 +12,16 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
-from app.api.middleware.logging import LoggingMiddleware
-from app.api.middleware.error_handler import ErrorHandlerMiddleware
-from app.api.middleware.request_id import RequestIDMiddleware
+from app.core.logging import configure_logging
+from app.core.metrics import get_metrics_store
+from app.core.secrets import (
+    get_database_url,
+    get_jwt_secret,
+    get_openai_api_key,
+    get_redis_url,
+)
+from app.api.middleware.compression import CompressionMiddleware
+from app.api.middleware.core import CoreMiddleware
 from app.api.endpoints import (
     auth,
     health,
@@ -29,10 +36,7 @@ from app.api.endpoints import (
 )
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO if not settings.DEBUG else logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+configure_logging(debug=settings.DEBUG)
 logger = logging.getLogger(__name__)
 
 # Configure rate limiter
@@ -47,6 +51,20 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Debug mode: {settings.DEBUG}")
 
+    # Warm secret caches in parallel so first requests never hit Secret Manager
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        *(
+            loop.run_in_executor(None, fetch)
+            for fetch in (
+                get_database_url,
+                get_jwt_secret,
+                get_openai_api_key,
+                get_redis_url,
+            )
+        )
+    )
+
     # Initialize connections (database, redis, etc.)
     # TODO: Add database connection pool initialization
     # TODO: Add Redis connection pool initialization
@@ -55,17 +73,22 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down MASS API...")
+    # Write out inference metrics still buffered for Redis
+    get_metrics_store().flush()
     # TODO: Close database connections
     # TODO: Close Redis connections
 
 
+_API_PREFIX = settings.API_V1_STR
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json",
-    docs_url=f"{settings.API_V1_STR}/docs",
-    redoc_url=f"{settings.API_V1_STR}/redoc",
+    openapi_url=f"{_API_PREFIX}/openapi.json",
+    docs_url=f"{_API_PREFIX}/docs",
+    redoc_url=f"{_API_PREFIX}/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -73,8 +96,8 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# Add middleware (order matters - first added is outermost)
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add middleware (order matters - last added is outermost)
+app.add_middleware(CompressionMiddleware, minimum_size=1000)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.BACKEND_CORS_ORIGINS,
@@ -82,23 +105,24 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(RequestIDMiddleware)
-app.add_middleware(LoggingMiddleware)
-app.add_middleware(ErrorHandlerMiddleware)
+# Request ID, request logging and error handling in a single ASGI layer
+app.add_middleware(CoreMiddleware)
 
 # Include routers
-app.include_router(health.router, prefix=settings.API_V1_STR, tags=["health"])
-app.include_router(auth.router, prefix=settings.API_V1_STR, tags=["authentication"])
-app.include_router(telemetry.router, prefix=settings.API_V1_STR, tags=["telemetry"])
-app.include_router(students.router, prefix=settings.API_V1_STR, tags=["students"])
-app.include_router(teachers.router, prefix=settings.API_V1_STR, tags=["teachers"])
-app.include_router(skills.router, prefix=settings.API_V1_STR, tags=["skills"])
-app.include_router(
-    transcription.router, prefix=settings.API_V1_STR, tags=["transcription"]
+_ROUTERS = (
+    (health, "health"),
+    (auth, "authentication"),
+    (telemetry, "telemetry"),
+    (students, "students"),
+    (teachers, "teachers"),
+    (skills, "skills"),
+    (transcription, "transcription"),
+    (features, "features"),
+    (assessments, "assessments"),
+    (inference, "inference"),
 )
-app.include_router(features.router, prefix=settings.API_V1_STR, tags=["features"])
-app.include_router(assessments.router, prefix=settings.API_V1_STR, tags=["assessments"])
-app.include_router(inference.router, prefix=settings.API_V1_STR, tags=["inference"])
+for _module, _tag in _ROUTERS:
+    app.include_router(_module.router, prefix=_API_PREFIX, tags=[_tag])
 
 
 @app.get("/")
@@ -108,14 +132,14 @@ async def root():
         "name": settings.PROJECT_NAME,
         "version": settings.VERSION,
         "status": "operational",
-        "docs": f"{settings.API_V1_STR}/docs",
+        "docs": f"{_API_PREFIX}/docs",
     }
 
 
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
     """Custom 404 handler."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "error": "Not Found",
@@ -3,27 +3,86 @@
 import logging
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import joblib
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Any
-from sklearn.metrics import (
-    mean_squared_error,
-    mean_absolute_error,
-    r2_score,
-)
-from scipy.stats import pearsonr, spearmanr
-import json
+from scipy.special import betainc
+from scipy.stats import rankdata
+import orjson
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from app.models.assessment import SkillType
+from app.ml.model_metadata import (
+    atomic_write_bytes,
+    load_feature_names,
+    load_model_file,
+    model_artifact_paths,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Absolute-error thresholds reported as within_<tol>
+_TOLERANCES = np.array([0.1, 0.15, 0.2])
+
+# (summary key, per-skill metric key) averaged across skills
+_SUMMARY_FIELDS = (
+    ("avg_pearson_r", "pearson_r"),
+    ("avg_spearman_r", "spearman_r"),
+    ("avg_rmse", "rmse"),
+    ("avg_mae", "mae"),
+    ("avg_r2", "r2_score"),
+)
+
+
+def _rowwise_correlation(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pearson r and two-sided p-value for each row pair of two (k, n) matrices.
+
+    Matches scipy.stats.pearsonr per row; applied to ranks it matches
+    scipy.stats.spearmanr.
+    """
+    n = a.shape[1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        za = (a - a.mean(axis=1, keepdims=True)) / a.std(axis=1, keepdims=True)
+        zb = (b - b.mean(axis=1, keepdims=True)) / b.std(axis=1, keepdims=True)
+        r = np.clip(np.einsum("ij,ij->i", za, zb) / n, -1.0, 1.0)
+
+    # Two-sided p from the t distribution with n-2 dof, via the regularized beta
+    dof = n - 2
+    p = betainc(0.5 * dof, 0.5, 1.0 - r * r) if dof > 0 else np.full_like(r, np.nan)
+    return r, p
+
+
+def batched_correlations(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Pearson and Spearman correlations for several skills at once.
+
+    Args:
+        y_true: (n_skills, n_samples) teacher ratings
+        y_pred: (n_skills, n_samples) model predictions
+
+    Returns:
+        Dictionary of per-skill correlation metric arrays
+    """
+    pearson_r, pearson_p = _rowwise_correlation(y_true, y_pred)
+    spearman_r, spearman_p = _rowwise_correlation(
+        rankdata(y_true, axis=1), rankdata(y_pred, axis=1)
+    )
+    return {
+        "pearson_r": pearson_r,
+        "pearson_p_value": pearson_p,
+        "spearman_r": spearman_r,
+        "spearman_p_value": spearman_p,
+    }
+
 
 class ModelEvaluator:
     """Evaluate trained models against ground truth teacher ratings."""
@@ -59,16 +118,20 @@ class ModelEvaluator:
     def _load_models(self):
         """Load trained models from disk."""
         for skill_type in self.skill_types:
-            model_path = self.models_dir / f"{skill_type.value}_model.pkl"
-            features_path = self.models_dir / f"{skill_type.value}_features.pkl"
+            model_path, features_path = model_artifact_paths(
+                self.models_dir, skill_type.value
+            )
 
             if model_path.exists():
                 try:
-                    self.models[skill_type] = joblib.load(model_path)
+                    # Memory-map pickled numpy arrays so workers share pages
+                    self.models[skill_type] = load_model_file(model_path, mmap_mode="r")
                     logger.info(f"Loaded model for {skill_type.value}")
 
                     if features_path.exists():
-                        self.feature_names[skill_type] = joblib.load(features_path)
+                        self.feature_names[skill_type] = load_feature_names(
+                            features_path
+                        )
                 except Exception as e:
                     logger.error(f"Failed to load model for {skill_type.value}: {e}")
             else:
@@ -89,7 +152,13 @@ class ModelEvaluator:
         if not self.test_data_path or not self.test_data_path.exists():
             raise FileNotFoundError(f"Test data not found: {self.test_data_path}")
 
-        df = pd.read_csv(self.test_data_path)
+        # Only parse the columns the loaded models will actually read
+        needed_cols = {"student_id"}
+        for skill_type in self.models:
+            needed_cols.update(self.feature_names.get(skill_type, []))
+            needed_cols.add(f"{skill_type.value}_teacher")
+
+        df = pd.read_csv(self.test_data_path, usecols=lambda c: c in needed_cols)
         logger.info(f"Loaded {len(df)} test examples with teacher ratings")
 
         return df
@@ -114,18 +183,24 @@ class ModelEvaluator:
         if not feature_names:
             raise ValueError(f"No feature names found for {skill_type.value}")
 
+        return self._feature_matrix(df, feature_names)
+
+    def _feature_matrix(
+        self,
+        df: pd.DataFrame,
+        feature_names: List[str],
+    ) -> np.ndarray:
+        """Select feature columns (zero-filling missing ones) as a NaN-free matrix."""
         # Check if all features exist
         missing_cols = [col for col in feature_names if col not in df.columns]
         if missing_cols:
             logger.warning(f"Missing feature columns: {missing_cols}")
-            for col in missing_cols:
-                df[col] = 0
 
-        # Extract features
-        X = df[feature_names].values
-        X = np.nan_to_num(X, nan=0.0)
-
-        return X
+        # One reindex zero-fills missing columns without mutating df, and
+        # to_numpy replaces NaNs; XGBoost predicts in float32 internally
+        return df.reindex(columns=feature_names, fill_value=0.0).to_numpy(
+            dtype=np.float32, na_value=0.0
+        )
 
     def calculate_correlation(
         self,
@@ -142,18 +217,12 @@ class ModelEvaluator:
         Returns:
             Dictionary of correlation metrics
         """
-        # Pearson correlation (linear relationship)
-        pearson_r, pearson_p = pearsonr(y_true, y_pred)
-
-        # Spearman correlation (rank-based, more robust)
-        spearman_r, spearman_p = spearmanr(y_true, y_pred)
-
-        return {
-            "pearson_r": float(pearson_r),
-            "pearson_p_value": float(pearson_p),
-            "spearman_r": float(spearman_r),
-            "spearman_p_value": float(spearman_p),
-        }
+        # Pearson (linear relationship) and Spearman (rank-based, more robust)
+        batched = batched_correlations(
+            np.asarray(y_true, dtype=np.float64)[np.newaxis],
+            np.asarray(y_pred, dtype=np.float64)[np.newaxis],
+        )
+        return {name: float(values[0]) for name, values in batched.items()}
 
     def calculate_regression_metrics(
         self,
@@ -170,15 +239,29 @@ class ModelEvaluator:
         Returns:
             Dictionary of metrics
         """
-        mse = mean_squared_error(y_true, y_pred)
+        # One residual array feeds MSE, MAE, R² and the tolerance fractions
+        n = len(y_true)
+        diff = y_true - y_pred
+        ss_res = float(np.dot(diff, diff))
+        mse = ss_res / n
         rmse = np.sqrt(mse)
-        mae = mean_absolute_error(y_true, y_pred)
-        r2 = r2_score(y_true, y_pred)
 
-        # Calculate percentage of predictions within tolerance
-        tolerance_10 = np.mean(np.abs(y_true - y_pred) <= 0.1)
-        tolerance_15 = np.mean(np.abs(y_true - y_pred) <= 0.15)
-        tolerance_20 = np.mean(np.abs(y_true - y_pred) <= 0.2)
+        abs_err = np.abs(diff, out=diff)
+        mae = abs_err.sum() / n
+
+        centered = y_true - y_true.mean()
+        ss_tot = float(np.dot(centered, centered))
+        if ss_tot > 0:
+            r2 = 1.0 - ss_res / ss_tot
+        else:
+            # Same convention as sklearn.metrics.r2_score for constant targets
+            r2 = 1.0 if ss_res == 0 else 0.0
+
+        # Calculate percentage of predictions within tolerance (one sorted pass)
+        abs_err.sort()
+        tolerance_10, tolerance_15, tolerance_20 = np.searchsorted(
+            abs_err, _TOLERANCES, side="right"
+        ) / len(abs_err)
 
         return {
             "mse": float(mse),
@@ -209,27 +292,59 @@ class ModelEvaluator:
             logger.warning(f"No model loaded for {skill_type.value}")
             return {}
 
+        y_true, y_pred = self.predict_skill(df, skill_type)
+        correlation_metrics = self.calculate_correlation(y_true, y_pred)
+        return self._build_skill_metrics(
+            skill_type, y_true, y_pred, correlation_metrics
+        )
+
+    def predict_skill(
+        self,
+        df: pd.DataFrame,
+        skill_type: SkillType,
+        X: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get clipped teacher ratings and model predictions for a skill.
+
+        Args:
+            df: Test data with teacher ratings
+            skill_type: Skill to predict
+            X: Precomputed feature matrix (extracted from df if not provided)
+
+        Returns:
+            Tuple of (y_true, y_pred)
+        """
         logger.info(f"Evaluating {skill_type.value} model")
 
         # Get model and features
         model = self.models[skill_type]
-        X = self.extract_features(df, skill_type)
+        if X is None:
+            X = self.extract_features(df, skill_type)
 
         # Get teacher ratings (ground truth)
         teacher_col = f"{skill_type.value}_teacher"
         if teacher_col not in df.columns:
             raise ValueError(f"Teacher rating column {teacher_col} not found")
 
-        y_true = df[teacher_col].values
-        y_true = np.nan_to_num(y_true, nan=0.5)
-        y_true = np.clip(y_true, 0.0, 1.0)
+        # Ratings live in [0, 1]; float32 is ample and halves metric bandwidth
+        y_true = np.clip(
+            df[teacher_col].to_numpy(dtype=np.float32, na_value=0.5), 0.0, 1.0
+        )
 
         # Make predictions
-        y_pred = model.predict(X)
-        y_pred = np.clip(y_pred, 0.0, 1.0)
+        y_pred = np.clip(model.predict(X).astype(np.float32, copy=False), 0.0, 1.0)
 
-        # Calculate metrics
-        correlation_metrics = self.calculate_correlation(y_true, y_pred)
+        return y_true, y_pred
+
+    def _build_skill_metrics(
+        self,
+        skill_type: SkillType,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        correlation_metrics: Dict[str, float],
+    ) -> Dict[str, Any]:
+        """Combine correlation and regression metrics for a skill and log them."""
         regression_metrics = self.calculate_regression_metrics(y_true, y_pred)
 
         # Combine all metrics
@@ -270,38 +385,74 @@ class ModelEvaluator:
             df = self.load_test_data()
 
         results = {}
-        summary_metrics = {
-            "avg_pearson_r": [],
-            "avg_spearman_r": [],
-            "avg_rmse": [],
-            "avg_mae": [],
-            "avg_r2": [],
-        }
-
-        for skill_type in self.skill_types:
-            if skill_type in self.models:
-                try:
-                    metrics = self.evaluate_skill(df, skill_type)
-                    results[skill_type.value] = metrics
+        summary_rows: List[List[float]] = []
 
-                    # Collect for averaging
-                    summary_metrics["avg_pearson_r"].append(metrics["pearson_r"])
-                    summary_metrics["avg_spearman_r"].append(metrics["spearman_r"])
-                    summary_metrics["avg_rmse"].append(metrics["rmse"])
-                    summary_metrics["avg_mae"].append(metrics["mae"])
-                    summary_metrics["avg_r2"].append(metrics["r2_score"])
+        evaluated = [st for st in self.skill_types if st in self.models]
 
+        # Extract the union of all skills' features once; skills share most columns
+        union_features = list(
+            dict.fromkeys(
+                name for st in evaluated for name in self.feature_names.get(st, [])
+            )
+        )
+        X_full = self._feature_matrix(df, union_features) if union_features else None
+        column_index = {name: i for i, name in enumerate(union_features)}
+
+        def predict(skill_type: SkillType) -> Tuple[np.ndarray, np.ndarray]:
+            skill_features = self.feature_names.get(skill_type)
+            X = (
+                X_full[:, [column_index[name] for name in skill_features]]
+                if skill_features
+                else None
+            )
+            return self.predict_skill(df, skill_type, X)
+
+        # Predict every skill first so correlations are computed in one batch.
+        # XGBoost releases the GIL in predict, so skills run concurrently; df is
+        # only read here.
+        predictions: Dict[SkillType, Tuple[np.ndarray, np.ndarray]] = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(evaluated))) as executor:
+            futures = {st: executor.submit(predict, st) for st in evaluated}
+            for skill_type, future in futures.items():
+                try:
+                    predictions[skill_type] = future.result()
                 except Exception as e:
                     logger.error(f"Failed to evaluate {skill_type.value}: {e}")
-                    continue
 
-        # Calculate averages
+        correlations: Dict[str, np.ndarray] = {}
+        if predictions:
+            y_true_all = np.stack([y for y, _ in predictions.values()]).astype(
+                np.float64
+            )
+            y_pred_all = np.stack([y for _, y in predictions.values()]).astype(
+                np.float64
+            )
+            correlations = batched_correlations(y_true_all, y_pred_all)
+
+        for row, (skill_type, (y_true, y_pred)) in enumerate(predictions.items()):
+            try:
+                correlation_metrics = {
+                    name: float(values[row]) for name, values in correlations.items()
+                }
+                metrics = self._build_skill_metrics(
+                    skill_type, y_true, y_pred, correlation_metrics
+                )
+                results[skill_type.value] = metrics
+
+                # Collect for averaging
+                summary_rows.append([metrics[key] for _, key in _SUMMARY_FIELDS])
+
+            except Exception as e:
+                logger.error(f"Failed to evaluate {skill_type.value}: {e}")
+
+        # Calculate averages: one column-wise mean over the (n_skills, 5) matrix
+        averages = (
+            np.asarray(summary_rows, dtype=np.float64)
+            .reshape(-1, len(_SUMMARY_FIELDS))
+            .mean(axis=0)
+        )
         summary = {
-            "avg_pearson_r": float(np.mean(summary_metrics["avg_pearson_r"])),
-            "avg_spearman_r": float(np.mean(summary_metrics["avg_spearman_r"])),
-            "avg_rmse": float(np.mean(summary_metrics["avg_rmse"])),
-            "avg_mae": float(np.mean(summary_metrics["avg_mae"])),
-            "avg_r2": float(np.mean(summary_metrics["avg_r2"])),
+            name: float(value) for (name, _), value in zip(_SUMMARY_FIELDS, averages)
         }
 
         results["summary"] = summary
@@ -332,8 +483,15 @@ class ModelEvaluator:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            json.dump(results, f, indent=2)
+        atomic_write_bytes(
+            output_path,
+            orjson.dumps(
+                results,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_NON_STR_KEYS,
+            ),
+        )
 
         logger.info(f"Saved evaluation report to {output_path}")
 
@@ -1,11 +1,93 @@
 """Model versioning and metadata management."""
 
-import json
 import hashlib
+import os
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
+from functools import partial
+
+import joblib
+import orjson
+import xgboost as xgb
+
+# Read size for the pre-3.11 checksum fallback
+_CHECKSUM_CHUNK_SIZE = 1 << 20
+
+# Checksum algorithms; integrity checks only, no cryptographic signature needed
+_HASH_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "sha256": hashlib.sha256,
+    "blake2b": partial(hashlib.blake2b, digest_size=32),
+}
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write a file atomically so concurrent readers never see a partial write.
+
+    Data goes to a uniquely named sibling temp file which then replaces
+    ``path`` via ``os.replace`` (atomic on POSIX and Windows).
+
+    Args:
+        path: Destination file
+        data: File contents
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.urandom(4).hex()}")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def model_artifact_paths(models_dir: Path, skill_type: str) -> Tuple[Path, Path]:
+    """
+    Locate a skill's model and feature-name files.
+
+    Native XGBoost UBJ models with JSON feature lists are preferred; pickles
+    written before native persistence are used when no UBJ model exists.
+
+    Args:
+        models_dir: Directory containing models
+        skill_type: Skill type (e.g., "empathy")
+
+    Returns:
+        Tuple of (model_path, features_path)
+    """
+    model_path = models_dir / f"{skill_type}_model.ubj"
+    features_path = models_dir / f"{skill_type}_features.json"
+    if not model_path.exists():
+        model_path = models_dir / f"{skill_type}_model.pkl"
+    if not features_path.exists():
+        features_path = models_dir / f"{skill_type}_features.pkl"
+    return model_path, features_path
+
+
+def load_model_file(path: Path, mmap_mode: Optional[str] = None) -> Any:
+    """
+    Load a model saved as native XGBoost UBJ or as a joblib pickle.
+
+    Args:
+        path: Model file
+        mmap_mode: joblib memory-map mode for pickled models
+
+    Returns:
+        Model exposing the scikit-learn predict API
+    """
+    if path.suffix == ".ubj":
+        model = xgb.XGBRegressor()
+        model.load_model(path)
+        return model
+    return joblib.load(path, mmap_mode=mmap_mode)
+
+
+def load_feature_names(path: Path) -> List[str]:
+    """Load a feature-name list saved as JSON or as a joblib pickle."""
+    if path.suffix == ".json":
+        return orjson.loads(path.read_bytes())
+    return joblib.load(path)
 
 
 @dataclass
@@ -20,7 +102,14 @@ class ModelMetadata:
     performance_metrics: Dict[str, float]
     feature_count: int
     training_samples: int
-    model_checksum: str  # SHA256 hash of model file
+    model_checksum: str  # Hash of model file, computed with hash_algo
+    # File stat at checksum time; lets verification skip rehashing unchanged files
+    size_bytes: Optional[int] = None
+    mtime_ns: Optional[int] = None
+    # Entries written before this field existed were hashed with SHA-256
+    hash_algo: str = "sha256"
+    # Model file name in models_dir; None means the per-skill default
+    model_file: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -35,14 +124,20 @@ class ModelMetadata:
 class ModelRegistry:
     """Registry for tracking model versions and metadata."""
 
-    def __init__(self, models_dir: str = "./models"):
+    def __init__(self, models_dir: str = "./models", hash_algo: str = "blake2b"):
         """
         Initialize model registry.
 
         Args:
             models_dir: Directory containing models
+            hash_algo: Checksum algorithm for newly registered models
+                ("blake2b" or "sha256")
         """
+        if hash_algo not in _HASH_FACTORIES:
+            raise ValueError(f"Unsupported hash algorithm: {hash_algo}")
+
         self.models_dir = Path(models_dir)
+        self.hash_algo = hash_algo
         self.registry_file = self.models_dir / "model_registry.json"
         self.registry: Dict[str, ModelMetadata] = {}
 
@@ -52,8 +147,7 @@ class ModelRegistry:
     def _load_registry(self):
         """Load registry from disk."""
         try:
-            with open(self.registry_file, "r") as f:
-                data = json.load(f)
+            data = orjson.loads(self.registry_file.read_bytes())
 
             for skill_type, metadata_dict in data.items():
                 self.registry[skill_type] = ModelMetadata.from_dict(metadata_dict)
@@ -70,16 +164,30 @@ class ModelRegistry:
             for skill_type, metadata in self.registry.items()
         }
 
-        with open(self.registry_file, "w") as f:
-            json.dump(data, f, indent=2)
+        atomic_write_bytes(
+            self.registry_file, orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        )
 
-    def _calculate_checksum(self, file_path: Path) -> str:
-        """Calculate SHA256 checksum of a file."""
-        sha256 = hashlib.sha256()
+    def _calculate_checksum(
+        self, file_path: Path, hash_algo: Optional[str] = None
+    ) -> str:
+        """Calculate checksum of a file (defaults to the registry's algorithm)."""
+        factory = _HASH_FACTORIES[hash_algo or self.hash_algo]
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: hashed in C straight from the file descriptor
+                return hashlib.file_digest(f, factory).hexdigest()
+
+            digest = factory()
+            buffer = bytearray(_CHECKSUM_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while n := f.readinto(buffer):
+                digest.update(view[:n])
+            return digest.hexdigest()
+
+    def _model_path(self, skill_type: str, model_file: Optional[str] = None) -> Path:
+        """Path of a skill's model file (shared files are named explicitly)."""
+        return self.models_dir / (model_file or f"{skill_type}_model.pkl")
 
     def register_model(
         self,
@@ -90,6 +198,7 @@ class ModelRegistry:
         performance_metrics: Dict[str, float],
         feature_count: int,
         training_samples: int,
+        model_file: Optional[str] = None,
     ):
         """
         Register a trained model.
@@ -102,13 +211,16 @@ class ModelRegistry:
             performance_metrics: Performance metrics from evaluation
             feature_count: Number of features
             training_samples: Number of training samples
+            model_file: Model file name in models_dir, for models shared
+                between skills (defaults to "<skill_type>_model.pkl")
         """
-        model_path = self.models_dir / f"{skill_type}_model.pkl"
+        model_path = self._model_path(skill_type, model_file)
 
         if not model_path.exists():
             raise FileNotFoundError(f"Model file not found: {model_path}")
 
         # Calculate checksum
+        stat = model_path.stat()
         checksum = self._calculate_checksum(model_path)
 
         # Create metadata
@@ -122,6 +234,10 @@ class ModelRegistry:
             feature_count=feature_count,
             training_samples=training_samples,
             model_checksum=checksum,
+            size_bytes=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            hash_algo=self.hash_algo,
+            model_file=model_file,
         )
 
         # Store in registry
@@ -144,6 +260,9 @@ class ModelRegistry:
         """
         Verify model file integrity using checksum.
 
+        The file is only rehashed when its size or mtime differ from the
+        values recorded alongside the checksum.
+
         Args:
             skill_type: Skill type
 
@@ -154,12 +273,27 @@ class ModelRegistry:
         if not metadata:
             return False
 
-        model_path = self.models_dir / f"{skill_type}_model.pkl"
-        if not model_path.exists():
+        model_path = self._model_path(skill_type, metadata.model_file)
+        try:
+            stat = model_path.stat()
+        except FileNotFoundError:
             return False
 
-        current_checksum = self._calculate_checksum(model_path)
-        return current_checksum == metadata.model_checksum
+        if (
+            metadata.size_bytes == stat.st_size
+            and metadata.mtime_ns == stat.st_mtime_ns
+        ):
+            return True
+
+        current_checksum = self._calculate_checksum(model_path, metadata.hash_algo)
+        if current_checksum != metadata.model_checksum:
+            return False
+
+        # Content unchanged (e.g. touched or copied): remember the new stat
+        metadata.size_bytes = stat.st_size
+        metadata.mtime_ns = stat.st_mtime_ns
+        self._save_registry()
+        return True
 
     def list_models(self) -> Dict[str, ModelMetadata]:
         """
@@ -2,13 +2,15 @@
 
 import logging
 import argparse
+import os
 import sys
 from pathlib import Path
-import joblib
+from joblib import Memory, Parallel, delayed
 import numpy as np
+import orjson
 import pandas as pd
-from typing import Dict, List, Tuple
-from sklearn.model_selection import train_test_split, cross_val_score
+from typing import Dict, List, Optional, Tuple
+from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
 import xgboost as xgb
 
@@ -18,15 +20,150 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 from app.models.assessment import SkillType
 from app.ml.model_metadata import ModelRegistry
 
+# Optional multithreaded CSV parser for load_data
+try:
+    import pyarrow  # noqa: F401
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional ahead-of-time compiler for serving models as native code
+try:
+    import tl2cgen
+    import treelite
+
+    TL2CGEN_AVAILABLE = True
+except ImportError:
+    TL2CGEN_AVAILABLE = False
+
+# Optional GPU array library; used to detect a CUDA device and keep data on it
+try:
+    import cupy
+
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _cuda_available() -> bool:
+    """Whether XGBoost was built with CUDA and a CUDA device is visible."""
+    if not CUPY_AVAILABLE or not xgb.build_info().get("USE_CUDA", False):
+        return False
+    try:
+        return cupy.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+_XGB_DEVICE = "cuda" if _cuda_available() else "cpu"
+
+
+def _read_training_csv(
+    data_path: str, mtime_ns: int, float_columns: Tuple[str, ...]
+) -> pd.DataFrame:
+    """
+    Read the training CSV with feature and target columns parsed as float32.
+
+    Skips dtype inference for the known numeric columns and uses the
+    multithreaded pyarrow parser when it is installed. mtime_ns only keys
+    the on-disk cache.
+    """
+    return pd.read_csv(
+        data_path,
+        dtype=dict.fromkeys(float_columns, "float32"),
+        engine="pyarrow" if PYARROW_AVAILABLE else "c",
+    )
+
+
+# Base linguistic features (16)
+_LINGUISTIC_FEATURES: Tuple[str, ...] = (
+    "empathy_markers",
+    "problem_solving_language",
+    "perseverance_indicators",
+    "social_processes",
+    "cognitive_processes",
+    "positive_sentiment",
+    "negative_sentiment",
+    "avg_sentence_length",
+    "syntactic_complexity",
+    "word_count",
+    "unique_word_count",
+    "readability_score",
+    "noun_count",
+    "verb_count",
+    "adj_count",
+    "adv_count",
+)
+
+# Base behavioral features (9)
+_BEHAVIORAL_FEATURES: Tuple[str, ...] = (
+    "task_completion_rate",
+    "time_efficiency",
+    "retry_count",
+    "recovery_rate",
+    "distraction_resistance",
+    "focus_duration",
+    "collaboration_indicators",
+    "leadership_indicators",
+    "event_count",
+)
+
+# Skill-specific derived feature
+_SKILL_FEATURE_MAP: Dict[SkillType, str] = {
+    SkillType.EMPATHY: "empathy_social_interaction",
+    SkillType.PROBLEM_SOLVING: "problem_solving_cognitive",
+    SkillType.SELF_REGULATION: "self_regulation_focus",
+    SkillType.RESILIENCE: "resilience_recovery",
+}
+
+_FEATURE_NAMES_BY_SKILL: Dict[SkillType, Tuple[str, ...]] = {
+    skill_type: _LINGUISTIC_FEATURES
+    + _BEHAVIORAL_FEATURES
+    + (_SKILL_FEATURE_MAP.get(skill_type, "derived_feature"),)
+    for skill_type in SkillType
+}
+
+# Target score column per skill
+_TARGET_COL: Dict[SkillType, str] = {
+    skill_type: f"{skill_type.value}_score" for skill_type in SkillType
+}
+
+# Boosting budget for train_model; early stopping usually ends well before it
+_MAX_BOOST_ROUNDS = 300
+_EARLY_STOPPING_ROUNDS = 20
+_MAX_BIN = 256
+
+# Tree hyperparameters shared by train_model and the registry entry
+_TREE_PARAMS = {
+    "max_depth": 5,
+    "learning_rate": 0.1,
+    "subsample": 0.8,
+    "colsample_bytree": 0.8,
+}
+
+# Native multi-output trees (one booster with vector leaves) need XGBoost 2.0+
+_MULTI_OUTPUT_SUPPORTED = int(xgb.__version__.split(".")[0]) >= 2
+
+# Shared booster written by train_multi_output, and its registry entry
+_MULTI_OUTPUT_MODEL_FILE = "multi_output_model.ubj"
+MULTI_OUTPUT_REGISTRY_KEY = "multi_output"
+_MULTI_OUTPUT_FEATURES_FILE = "multi_output_features.json"
+
+
 class SkillModelTrainer:
     """Train XGBoost models for skill inference."""
 
     def __init__(
-        self, data_path: str, models_dir: str = "./models", model_version: str = "1.0.0"
+        self,
+        data_path: str,
+        models_dir: str = "./models",
+        model_version: str = "1.0.0",
+        cache_dir: Optional[str] = None,
+        compile_models: bool = False,
     ):
         """
         Initialize the model trainer.
@@ -35,12 +172,27 @@ class SkillModelTrainer:
             data_path: Path to training data CSV
             models_dir: Directory to save trained models
             model_version: Version string for trained models
+            cache_dir: Directory for caching the parsed training data across
+                runs, keyed on the CSV's mtime (disabled if None)
+            compile_models: Also compile each model to a shared library with
+                Treelite/TL2cgen for faster serving
         """
         self.data_path = Path(data_path)
         self.models_dir = Path(models_dir)
         self.models_dir.mkdir(parents=True, exist_ok=True)
         self.model_version = model_version
 
+        if compile_models and not TL2CGEN_AVAILABLE:
+            logger.warning("treelite/tl2cgen not installed; skipping model compilation")
+        self.compile_models = compile_models and TL2CGEN_AVAILABLE
+
+        # Repeated runs (e.g. hyperparameter tuning) reuse the parsed CSV
+        self._read_csv = (
+            Memory(cache_dir, verbose=0).cache(_read_training_csv)
+            if cache_dir
+            else _read_training_csv
+        )
+
         # Initialize model registry
         self.registry = ModelRegistry(models_dir=str(self.models_dir))
 
@@ -52,6 +204,12 @@ class SkillModelTrainer:
             SkillType.RESILIENCE,
         ]
 
+        # Float32 union feature matrix shared by all skills (see cache_features)
+        self._cached_df: Optional[pd.DataFrame] = None
+        self._feature_matrix: Optional[np.ndarray] = None
+        self._col_idx: Dict[str, int] = {}
+        self._targets: Dict[SkillType, np.ndarray] = {}
+
         logger.info(f"Initialized trainer with data from {self.data_path}")
         logger.info(f"Model version: {self.model_version}")
 
@@ -72,7 +230,12 @@ class SkillModelTrainer:
         if not self.data_path.exists():
             raise FileNotFoundError(f"Data file not found: {self.data_path}")
 
-        df = pd.read_csv(self.data_path)
+        float_columns = tuple(self.get_multi_output_feature_names()) + tuple(
+            _TARGET_COL[st] for st in self.skill_types
+        )
+        df = self._read_csv(
+            str(self.data_path), self.data_path.stat().st_mtime_ns, float_columns
+        )
         logger.info(
             f"Loaded {len(df)} training examples with {len(df.columns)} features"
         )
@@ -89,51 +252,64 @@ class SkillModelTrainer:
         Returns:
             List of feature names
         """
-        # Base linguistic features (16)
-        linguistic_features = [
-            "empathy_markers",
-            "problem_solving_language",
-            "perseverance_indicators",
-            "social_processes",
-            "cognitive_processes",
-            "positive_sentiment",
-            "negative_sentiment",
-            "avg_sentence_length",
-            "syntactic_complexity",
-            "word_count",
-            "unique_word_count",
-            "readability_score",
-            "noun_count",
-            "verb_count",
-            "adj_count",
-            "adv_count",
-        ]
+        return list(_FEATURE_NAMES_BY_SKILL[skill_type])
 
-        # Base behavioral features (9)
-        behavioral_features = [
-            "task_completion_rate",
-            "time_efficiency",
-            "retry_count",
-            "recovery_rate",
-            "distraction_resistance",
-            "focus_duration",
-            "collaboration_indicators",
-            "leadership_indicators",
-            "event_count",
-        ]
+    def get_multi_output_feature_names(self) -> List[str]:
+        """
+        Get the union of feature names across all skills.
 
-        # Skill-specific derived feature
-        skill_feature_map = {
-            SkillType.EMPATHY: "empathy_social_interaction",
-            SkillType.PROBLEM_SOLVING: "problem_solving_cognitive",
-            SkillType.SELF_REGULATION: "self_regulation_focus",
-            SkillType.RESILIENCE: "resilience_recovery",
-        }
+        Shared linguistic and behavioral features come first, followed by
+        each skill's derived feature in skill order.
 
-        all_features = linguistic_features + behavioral_features
-        all_features.append(skill_feature_map.get(skill_type, "derived_feature"))
+        Returns:
+            List of feature names
+        """
+        return list(
+            dict.fromkeys(
+                name
+                for skill_type in self.skill_types
+                for name in self.get_feature_names(skill_type)
+            )
+        )
 
-        return all_features
+    def cache_features(self, df: pd.DataFrame):
+        """
+        Extract all skills' features and targets from df in one pass.
+
+        Builds one contiguous float32 matrix over the union of feature
+        columns (NaNs replaced in place) plus clipped targets per skill, so
+        prepare_data gathers columns instead of re-slicing the DataFrame.
+
+        Args:
+            df: Training data
+        """
+        feature_names = self.get_multi_output_feature_names()
+
+        # Check if all feature columns exist
+        missing_cols = sorted(set(feature_names).difference(df.columns))
+        if missing_cols:
+            logger.warning(f"Missing feature columns: {missing_cols}")
+            # Fill missing columns with zeros
+            for col in missing_cols:
+                df[col] = 0
+
+        # copy=True: the NaN fill below must never write into df's own blocks
+        matrix = np.ascontiguousarray(
+            df[feature_names].to_numpy(dtype=np.float32, copy=True)
+        )
+        np.nan_to_num(matrix, copy=False, nan=0.0)
+
+        targets = {}
+        for skill_type in self.skill_types:
+            target_col = _TARGET_COL[skill_type]
+            if target_col in df.columns:
+                y = df[target_col].to_numpy(dtype=np.float32, na_value=0.5, copy=True)
+                targets[skill_type] = np.clip(y, 0.0, 1.0, out=y)
+
+        self._cached_df = df
+        self._feature_matrix = matrix
+        self._col_idx = {name: i for i, name in enumerate(feature_names)}
+        self._targets = targets
 
     def prepare_data(
         self,
@@ -143,6 +319,8 @@ class SkillModelTrainer:
         """
         Prepare features and target for training.
 
+        Uses the matrix from cache_features when it was built from df.
+
         Args:
             df: Training data
             skill_type: Skill to train
@@ -151,10 +329,23 @@ class SkillModelTrainer:
             Tuple of (X, y, feature_names)
         """
         feature_names = self.get_feature_names(skill_type)
-        target_col = f"{skill_type.value}_score"
+        target_col = _TARGET_COL[skill_type]
+
+        if df is self._cached_df:
+            if skill_type not in self._targets:
+                raise ValueError(f"Target column {target_col} not found in data")
+            X = self._feature_matrix.take(
+                [self._col_idx[c] for c in feature_names], axis=1
+            )
+            y = self._targets[skill_type]
+            logger.info(
+                f"Prepared {len(X)} samples with {len(feature_names)} features "
+                f"for {skill_type.value}"
+            )
+            return X, y, feature_names
 
         # Check if all feature columns exist
-        missing_cols = [col for col in feature_names if col not in df.columns]
+        missing_cols = sorted(set(feature_names).difference(df.columns))
         if missing_cols:
             logger.warning(f"Missing feature columns: {missing_cols}")
             # Fill missing columns with zeros
@@ -165,16 +356,14 @@ class SkillModelTrainer:
         if target_col not in df.columns:
             raise ValueError(f"Target column {target_col} not found in data")
 
-        # Extract features and target
-        X = df[feature_names].values
-        y = df[target_col].values
+        # Extract features and target as fresh float32 arrays; missing
+        # targets become 0.5 during the conversion
+        X = df[feature_names].to_numpy(dtype=np.float32, copy=True)
+        y = df[target_col].to_numpy(dtype=np.float32, na_value=0.5, copy=True)
 
-        # Handle missing values
-        X = np.nan_to_num(X, nan=0.0)
-        y = np.nan_to_num(y, nan=0.5)
-
-        # Ensure target is in 0-1 range
-        y = np.clip(y, 0.0, 1.0)
+        # Handle missing features and keep the target in 0-1 range, in place
+        np.nan_to_num(X, copy=False, nan=0.0)
+        np.clip(y, 0.0, 1.0, out=y)
 
         logger.info(
             f"Prepared {len(X)} samples with {len(feature_names)} features for {skill_type.value}"
@@ -187,48 +376,75 @@ class SkillModelTrainer:
         X: np.ndarray,
         y: np.ndarray,
         skill_type: SkillType,
-    ) -> Tuple[xgb.XGBRegressor, Dict[str, float]]:
+        n_jobs: Optional[int] = None,
+    ) -> Tuple[xgb.Booster, Dict[str, float]]:
         """
         Train XGBoost model for a skill.
 
+        The early-stopped booster is returned as-is; save_model writes it
+        natively, so no sklearn wrapper or serialization round-trip is needed.
+
         Args:
             X: Feature matrix
             y: Target scores
             skill_type: Skill type
+            n_jobs: CPU threads for boosting (all cores if None)
 
         Returns:
             Tuple of (trained model, performance metrics dict)
         """
-        logger.info(f"Training XGBoost model for {skill_type.value}")
+        logger.info(f"Training XGBoost model for {skill_type.value} on {_XGB_DEVICE}")
 
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=0.2, random_state=42
         )
 
-        # Configure XGBoost
-        model = xgb.XGBRegressor(
-            objective="reg:squarederror",
-            n_estimators=100,
-            max_depth=5,
-            learning_rate=0.1,
-            subsample=0.8,
-            colsample_bytree=0.8,
-            random_state=42,
-            n_jobs=-1,
+        on_gpu = _XGB_DEVICE == "cuda"
+        params = {
+            "objective": "reg:squarederror",
+            **_TREE_PARAMS,
+            "seed": 42,
+            "tree_method": "hist",
+            "device": _XGB_DEVICE,
+            "max_bin": _MAX_BIN,
+        }
+        if not on_gpu and n_jobs is not None:
+            params["nthread"] = n_jobs
+
+        # On GPU copy the splits to the device once so binning, evaluation
+        # and prediction don't each do a host-to-device transfer
+        if on_gpu:
+            X_fit, y_fit = cupy.asarray(X_train), cupy.asarray(y_train)
+            X_eval, y_eval = cupy.asarray(X_test), cupy.asarray(y_test)
+        else:
+            X_fit, y_fit, X_eval, y_eval = X_train, y_train, X_test, y_test
+
+        # Quantize features into histogram bins once; the test set reuses
+        # the training cut points
+        dtrain = xgb.QuantileDMatrix(X_fit, y_fit, max_bin=_MAX_BIN)
+        dtest = xgb.QuantileDMatrix(X_eval, y_eval, ref=dtrain)
+
+        booster = xgb.train(
+            params,
+            dtrain,
+            num_boost_round=_MAX_BOOST_ROUNDS,
+            evals=[(dtest, "test")],
+            early_stopping_rounds=_EARLY_STOPPING_ROUNDS,
+            verbose_eval=False,
         )
-
-        # Train model
-        model.fit(
-            X_train,
-            y_train,
-            eval_set=[(X_test, y_test)],
-            verbose=False,
+        # Drop the trees grown after the best round
+        booster = booster[: booster.best_iteration + 1]
+        logger.info(
+            f"Early stopping kept {booster.num_boosted_rounds()} boosting rounds"
         )
 
-        # Evaluate on test set
-        y_pred = model.predict(X_test)
-        y_pred = np.clip(y_pred, 0.0, 1.0)
+        # Evaluate on test set, predicting straight from the array without
+        # building another DMatrix
+        y_pred = booster.inplace_predict(X_eval)
+        if on_gpu:
+            y_pred = cupy.asnumpy(y_pred)
+        np.clip(y_pred, 0.0, 1.0, out=y_pred)
 
         mse = mean_squared_error(y_test, y_pred)
         mae = mean_absolute_error(y_test, y_pred)
@@ -239,12 +455,23 @@ class SkillModelTrainer:
         logger.info(f"  MAE: {mae:.4f}")
         logger.info(f"  R2: {r2:.4f}")
 
-        # Cross-validation
-        cv_scores = cross_val_score(
-            model, X, y, cv=5, scoring="neg_mean_squared_error", n_jobs=-1
+        # Native 5-fold cross-validation with the kept round count: one
+        # DMatrix for all folds, boosted in lockstep (xgb.cv does not
+        # accept QuantileDMatrix)
+        dfull = xgb.DMatrix(cupy.asarray(X) if on_gpu else X, label=y)
+        cv_results = xgb.cv(
+            params,
+            dfull,
+            num_boost_round=booster.num_boosted_rounds(),
+            nfold=5,
+            metrics="rmse",
+            seed=42,
+            as_pandas=False,
         )
-        cv_mse = -cv_scores.mean()
-        cv_std = cv_scores.std()
+        cv_rmse = cv_results["test-rmse-mean"][-1]
+        cv_mse = cv_rmse**2
+        # Fold-to-fold spread of MSE, propagated from the RMSE spread
+        cv_std = 2 * cv_rmse * cv_results["test-rmse-std"][-1]
 
         logger.info(f"  CV MSE: {cv_mse:.4f} (+/- {cv_std:.4f})")
 
@@ -257,11 +484,11 @@ class SkillModelTrainer:
             "cv_std": float(cv_std),
         }
 
-        return model, metrics
+        return booster, metrics
 
     def save_model(
         self,
-        model: xgb.XGBRegressor,
+        model: xgb.Booster,
         feature_names: List[str],
         skill_type: SkillType,
         performance_metrics: Dict[str, float],
@@ -271,29 +498,40 @@ class SkillModelTrainer:
         Save trained model, feature names, and metadata.
 
         Args:
-            model: Trained model
+            model: Trained booster
             feature_names: List of feature names
             skill_type: Skill type
             performance_metrics: Performance metrics from evaluation
             training_samples: Number of training samples
         """
-        model_path = self.models_dir / f"{skill_type.value}_model.pkl"
-        features_path = self.models_dir / f"{skill_type.value}_features.pkl"
+        model_file = f"{skill_type.value}_model.ubj"
+        model_path = self.models_dir / model_file
+        features_path = self.models_dir / f"{skill_type.value}_features.json"
 
-        # Save model and features
-        joblib.dump(model, model_path)
-        joblib.dump(feature_names, features_path)
+        # Save model in XGBoost's native binary format and features as JSON
+        model.save_model(model_path)
+        features_path.write_bytes(orjson.dumps(feature_names))
 
         logger.info(f"Saved model to {model_path}")
         logger.info(f"Saved feature names to {features_path}")
 
+        # A library compiled from an earlier model must never outlive it
+        compiled_path = self.models_dir / f"{skill_type.value}_model.so"
+        if self.compile_models:
+            tl2cgen.export_lib(
+                treelite.frontend.from_xgboost(model),
+                toolchain="gcc",
+                libpath=str(compiled_path),
+                params={"quantize": 1, "parallel_comp": os.cpu_count() or 1},
+            )
+            logger.info(f"Compiled model to {compiled_path}")
+        else:
+            compiled_path.unlink(missing_ok=True)
+
         # Register model with metadata
         hyperparameters = {
-            "n_estimators": model.n_estimators,
-            "max_depth": model.max_depth,
-            "learning_rate": model.learning_rate,
-            "subsample": model.subsample,
-            "colsample_bytree": model.colsample_bytree,
+            "n_estimators": model.num_boosted_rounds(),
+            **_TREE_PARAMS,
         }
 
         self.registry.register_model(
@@ -304,44 +542,180 @@ class SkillModelTrainer:
             performance_metrics=performance_metrics,
             feature_count=len(feature_names),
             training_samples=training_samples,
+            model_file=model_file,
         )
 
         logger.info(
             f"Registered model {skill_type.value} v{self.model_version} in registry"
         )
 
-    def train_all_skills(self):
-        """Train models for all skills."""
-        # Load data
+    def train_multi_output(self):
+        """
+        Train one multi-output model covering all skills.
+
+        Every skill shares one booster trained on the union of feature
+        columns, so data ingestion, histogram construction and split search
+        happen once instead of once per skill. The shared model is registered
+        under its own key so the per-skill entries keep describing the
+        per-skill model files that inference loads; the output column order
+        is recorded in the hyperparameters. Falls back to train_all_skills
+        on XGBoost < 2.0.
+        """
+        if not _MULTI_OUTPUT_SUPPORTED:
+            logger.warning(
+                f"XGBoost {xgb.__version__} lacks multi-output trees; "
+                "training one model per skill"
+            )
+            self.train_all_skills()
+            return
+
         df = self.load_data()
+        self.cache_features(df)
+        feature_names = self.get_multi_output_feature_names()
 
-        # Train each skill model
-        for skill_type in self.skill_types:
-            try:
-                logger.info(f"\n{'='*60}")
-                logger.info(f"Training model for {skill_type.value}")
-                logger.info(f"{'='*60}")
+        missing_targets = [
+            _TARGET_COL[st] for st in self.skill_types if st not in self._targets
+        ]
+        if missing_targets:
+            raise ValueError(f"Target columns {missing_targets} not found in data")
+
+        # The cached matrix is already laid out in union feature order
+        X = self._feature_matrix
+        Y = np.column_stack([self._targets[st] for st in self.skill_types])
+
+        logger.info(
+            f"Training multi-output XGBoost model for {len(self.skill_types)} skills "
+            f"on {len(X)} samples with {len(feature_names)} features"
+        )
+
+        X_train, X_test, Y_train, Y_test = train_test_split(
+            X, Y, test_size=0.2, random_state=42
+        )
 
-                # Prepare data
-                X, y, feature_names = self.prepare_data(df, skill_type)
+        # Vector-leaf trees are only implemented for the CPU hist builder
+        model = xgb.XGBRegressor(
+            objective="reg:squarederror",
+            n_estimators=100,
+            max_depth=5,
+            learning_rate=0.1,
+            subsample=0.8,
+            colsample_bytree=0.8,
+            random_state=42,
+            tree_method="hist",
+            multi_strategy="multi_output_tree",
+            n_jobs=-1,
+        )
+        model.fit(X_train, Y_train, eval_set=[(X_test, Y_test)], verbose=False)
+
+        Y_pred = model.get_booster().inplace_predict(X_test)
+        np.clip(Y_pred, 0.0, 1.0, out=Y_pred)
+
+        # Per-skill metrics, one column per skill
+        residuals = Y_pred - Y_test
+        mse = np.mean(residuals**2, axis=0)
+        mae = np.mean(np.abs(residuals), axis=0)
+        ss_tot = np.sum((Y_test - Y_test.mean(axis=0)) ** 2, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2 = np.where(ss_tot > 0, 1.0 - mse * len(Y_test) / ss_tot, 0.0)
+
+        model.save_model(self.models_dir / _MULTI_OUTPUT_MODEL_FILE)
+        (self.models_dir / _MULTI_OUTPUT_FEATURES_FILE).write_bytes(
+            orjson.dumps(feature_names)
+        )
+        logger.info(
+            f"Saved multi-output model to {self.models_dir / _MULTI_OUTPUT_MODEL_FILE}"
+        )
 
-                # Train model and get metrics
-                model, metrics = self.train_model(X, y, skill_type)
+        performance_metrics = {}
+        for index, skill_type in enumerate(self.skill_types):
+            logger.info(
+                f"Model performance for {skill_type.value}: MSE {mse[index]:.4f}, "
+                f"MAE {mae[index]:.4f}, R2 {r2[index]:.4f}"
+            )
+            performance_metrics[f"{skill_type.value}_mse"] = float(mse[index])
+            performance_metrics[f"{skill_type.value}_mae"] = float(mae[index])
+            performance_metrics[f"{skill_type.value}_r2"] = float(r2[index])
 
-                # Save model with metadata
+        self.registry.register_model(
+            skill_type=MULTI_OUTPUT_REGISTRY_KEY,
+            version=self.model_version,
+            model_type="XGBRegressor",
+            hyperparameters={
+                "n_estimators": model.n_estimators,
+                "max_depth": model.max_depth,
+                "learning_rate": model.learning_rate,
+                "subsample": model.subsample,
+                "colsample_bytree": model.colsample_bytree,
+                "multi_strategy": model.multi_strategy,
+                "outputs": [skill_type.value for skill_type in self.skill_types],
+            },
+            performance_metrics=performance_metrics,
+            feature_count=len(feature_names),
+            training_samples=len(X),
+            model_file=_MULTI_OUTPUT_MODEL_FILE,
+        )
+        logger.info(
+            f"Registered model {MULTI_OUTPUT_REGISTRY_KEY} v{self.model_version} "
+            "in registry"
+        )
+
+        logger.info(f"\nTraining complete. Models saved to {self.models_dir}")
+
+    def _train_skill(
+        self,
+        df: pd.DataFrame,
+        skill_type: SkillType,
+        n_jobs: Optional[int],
+    ) -> Optional[Tuple[xgb.Booster, Dict[str, float], List[str], int]]:
+        """Prepare and train one skill; returns None if training failed."""
+        try:
+            logger.info(f"Training model for {skill_type.value}")
+            X, y, feature_names = self.prepare_data(df, skill_type)
+            model, metrics = self.train_model(X, y, skill_type, n_jobs=n_jobs)
+            return model, metrics, feature_names, len(X)
+        except Exception as e:
+            logger.error(f"Failed to train model for {skill_type.value}: {e}")
+            return None
+
+    def train_all_skills(self):
+        """Train models for all skills."""
+        # Load data and extract every skill's features once
+        df = self.load_data()
+        self.cache_features(df)
+
+        # Skills are independent and XGBoost releases the GIL while
+        # boosting, so train them on threads with the cores split between
+        # them. A single GPU is the bottleneck, so train in turn there.
+        cpu_count = os.cpu_count() or 1
+        if _XGB_DEVICE == "cuda":
+            n_workers, n_jobs = 1, None
+        else:
+            n_workers = max(1, min(len(self.skill_types), cpu_count // 4))
+            n_jobs = max(1, cpu_count // n_workers)
+
+        results = Parallel(n_jobs=n_workers, backend="threading")(
+            delayed(self._train_skill)(df, skill_type, n_jobs)
+            for skill_type in self.skill_types
+        )
+
+        # Save and register from this thread only, so the registry file has
+        # a single writer
+        for skill_type, result in zip(self.skill_types, results):
+            if result is None:
+                continue
+
+            model, metrics, feature_names, training_samples = result
+            try:
                 self.save_model(
                     model,
                     feature_names,
                     skill_type,
                     performance_metrics=metrics,
-                    training_samples=len(X),
+                    training_samples=training_samples,
                 )
-
                 logger.info(f"Successfully trained model for {skill_type.value}\n")
-
             except Exception as e:
-                logger.error(f"Failed to train model for {skill_type.value}: {e}")
-                continue
+                logger.error(f"Failed to save model for {skill_type.value}: {e}")
 
         logger.info(f"\nTraining complete. Models saved to {self.models_dir}")
 
@@ -363,12 +737,36 @@ def main():
         default="./models",
         help="Directory to save trained models",
     )
+    parser.add_argument(
+        "--multi-output",
+        action="store_true",
+        help="Train one shared multi-output model instead of one per skill",
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Also compile models to shared libraries with Treelite/TL2cgen",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory for caching parsed training data between runs",
+    )
 
     args = parser.parse_args()
 
     # Train models
-    trainer = SkillModelTrainer(args.data, args.models_dir)
-    trainer.train_all_skills()
+    trainer = SkillModelTrainer(
+        args.data,
+        args.models_dir,
+        cache_dir=args.cache_dir,
+        compile_models=args.compile,
+    )
+    if args.multi_output:
+        trainer.train_multi_output()
+    else:
+        trainer.train_all_skills()
 
 
 if __name__ == "__main__":
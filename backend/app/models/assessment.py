@@ -5,7 +5,7 @@ from sqlalchemy import String, ForeignKey, Float, Text, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import List, Optional
 
-from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.base import Base, CompressedText, TimestampMixin, UUIDMixin
 
 
 class SkillType(enum.Enum):
@@ -28,15 +28,31 @@ class EvidenceType(enum.Enum):
     CONTEXTUAL = "contextual"
 
 
+def _enum_column_type(enum_class: type, constraint_name: str) -> Enum:
+    """
+    Store an enum as VARCHAR guarded by a CHECK constraint.
+
+    Avoids a native Postgres ENUM type, whose OID lookups and ALTER TYPE
+    migrations cost more than a plain string; Python still sees enum members.
+    """
+    return Enum(
+        enum_class,
+        native_enum=False,
+        create_constraint=True,
+        length=32,
+        name=constraint_name,
+    )
+
+
 class Evidence(Base, UUIDMixin, TimestampMixin):
     """Evidence supporting a skill assessment."""
 
     __tablename__ = "evidence"
 
     assessment_id: Mapped[str] = mapped_column(String(36), ForeignKey("skill_assessments.id"), nullable=False, index=True)
-    evidence_type: Mapped[EvidenceType] = mapped_column(Enum(EvidenceType), nullable=False)
+    evidence_type: Mapped[EvidenceType] = mapped_column(_enum_column_type(EvidenceType, "ck_evidence_type"), nullable=False)
     source: Mapped[str] = mapped_column(String(255), nullable=False)  # transcript, telemetry, etc.
-    content: Mapped[str] = mapped_column(Text, nullable=False)
+    content: Mapped[str] = mapped_column(CompressedText(), nullable=False)  # zstd-compressed
     relevance_score: Mapped[float] = mapped_column(Float, nullable=False)
 
     # Relationships
@@ -52,7 +68,7 @@ class SkillAssessment(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "skill_assessments"
 
     student_id: Mapped[str] = mapped_column(String(36), ForeignKey("students.id"), nullable=False, index=True)
-    skill_type: Mapped[SkillType] = mapped_column(Enum(SkillType), nullable=False, index=True)
+    skill_type: Mapped[SkillType] = mapped_column(_enum_column_type(SkillType, "ck_skill_type"), nullable=False, index=True)
 
     # Assessment scores
     score: Mapped[float] = mapped_column(Float, nullable=False)  # 0-1 scale
@@ -67,7 +83,8 @@ class SkillAssessment(Base, UUIDMixin, TimestampMixin):
 
     # Relationships
     student = relationship("Student", back_populates="skill_assessments")
-    evidence: Mapped[List["Evidence"]] = relationship("Evidence", back_populates="assessment", cascade="all, delete-orphan")
+    # Always rendered with the assessment, so batch-load it for every query
+    evidence: Mapped[List["Evidence"]] = relationship("Evidence", back_populates="assessment", cascade="all, delete-orphan", lazy="selectin")
 
     __table_args__ = (
         Index("idx_skill_assessment_student_skill_created", "student_id", "skill_type", "created_at"),
@@ -84,7 +101,7 @@ class RubricAssessment(Base, UUIDMixin, TimestampMixin):
 
     student_id: Mapped[str] = mapped_column(String(36), ForeignKey("students.id"), nullable=False, index=True)
     teacher_id: Mapped[str] = mapped_column(String(36), ForeignKey("teachers.id"), nullable=False, index=True)
-    skill_type: Mapped[SkillType] = mapped_column(Enum(SkillType), nullable=False, index=True)
+    skill_type: Mapped[SkillType] = mapped_column(_enum_column_type(SkillType, "ck_skill_type"), nullable=False, index=True)
 
     # Rubric score (1-4 scale as per PRD)
     score: Mapped[int] = mapped_column(nullable=False)  # 1-4 scale
@@ -1,6 +1,6 @@
 """Audio file and transcript models."""
 
-from sqlalchemy import String, ForeignKey, Integer, Float, Text
+from sqlalchemy import String, ForeignKey, Integer, Float, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional
 
@@ -18,6 +18,7 @@ class AudioFile(Base, UUIDMixin, TimestampMixin):
     file_size_bytes: Mapped[int] = mapped_column(Integer, nullable=True)
     source_type: Mapped[str] = mapped_column(String(50), nullable=False)  # classroom, interview, etc.
     recording_date: Mapped[str] = mapped_column(String(50), nullable=True)
+    sha256: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)  # Hex digest of uploaded content
 
     # Processing status
     transcription_status: Mapped[str] = mapped_column(
@@ -31,5 +32,9 @@ class AudioFile(Base, UUIDMixin, TimestampMixin):
     student = relationship("Student", back_populates="audio_files")
     transcripts: Mapped["Transcript"] = relationship("Transcript", back_populates="audio_file", uselist=False)
 
+    __table_args__ = (
+        Index("idx_audio_file_student_sha256", "student_id", "sha256", unique=True),
+    )
+
     def __repr__(self):
         return f"<AudioFile {self.id} for Student {self.student_id}>"
@@ -1,9 +1,46 @@
 """Base model for all database models."""
 
 from datetime import datetime
-from sqlalchemy import DateTime, String
+from typing import Optional
+
+import zstandard
+from sqlalchemy import JSON, DateTime, LargeBinary, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
+
+# Binary, indexable JSONB on PostgreSQL; plain JSON elsewhere (e.g. SQLite tests)
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text stored as a zstd frame in a binary (BYTEA) column.
+
+    Compressed in the application rather than by TOAST's pglz, which is
+    slower and compresses prose less well; Python still sees ``str``.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, level: int = 3):
+        super().__init__()
+        self.level = level
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        # Compressor objects are not safe to share across threads
+        return zstandard.ZstdCompressor(level=self.level).compress(
+            value.encode("utf-8")
+        )
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return zstandard.ZstdDecompressor().decompress(value).decode("utf-8")
 
 
 class Base(DeclarativeBase):
@@ -1,10 +1,10 @@
 """Feature extraction models for ML pipeline."""
 
-from sqlalchemy import String, ForeignKey, JSON, Float, Integer
+from sqlalchemy import String, ForeignKey, Float, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Dict, Any, Optional
 
-from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.base import Base, JSONDocument, TimestampMixin, UUIDMixin
 
 
 class LinguisticFeatures(Base, UUIDMixin, TimestampMixin):
@@ -31,14 +31,19 @@ class LinguisticFeatures(Base, UUIDMixin, TimestampMixin):
     syntactic_complexity: Mapped[float] = mapped_column(Float, default=0.0)
 
     # Word embeddings (stored as JSON for flexibility)
-    word_embeddings: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    word_embeddings: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONDocument, nullable=True)
 
     # All features as JSON for ML models
-    features_json: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    features_json: Mapped[Dict[str, Any]] = mapped_column(JSONDocument, nullable=False)
 
     # Relationships
     transcript = relationship("Transcript", back_populates="linguistic_features")
 
+    __table_args__ = (
+        # Key lookups into the feature document
+        Index("idx_ling_features_gin", "features_json", postgresql_using="gin"),
+    )
+
     def __repr__(self):
         return f"<LinguisticFeatures for Transcript {self.transcript_id}>"
 
@@ -68,7 +73,7 @@ class BehavioralFeatures(Base, UUIDMixin, TimestampMixin):
     leadership_indicators: Mapped[int] = mapped_column(Integer, default=0)
 
     # All features as JSON for ML models
-    features_json: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    features_json: Mapped[Dict[str, Any]] = mapped_column(JSONDocument, nullable=False)
 
     # Relationships
     session = relationship("GameSession")
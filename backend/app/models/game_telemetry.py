@@ -1,11 +1,11 @@
 """Game telemetry models for Flourish Academy."""
 
-from sqlalchemy import String, ForeignKey, JSON, DateTime, Index
+from sqlalchemy import String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import List, Dict, Any
 from datetime import datetime
 
-from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.base import Base, JSONDocument, TimestampMixin, UUIDMixin
 
 
 class GameSession(Base, UUIDMixin, TimestampMixin):
@@ -35,6 +35,10 @@ class GameTelemetry(Base, UUIDMixin):
     """
     Game telemetry events (TimescaleDB hypertable).
     This table will be converted to a hypertable for efficient time-series queries.
+
+    Chunks are partitioned by ``timestamp`` and by a 16-way hash of
+    ``student_id`` (see ``init_db``), so ``WHERE student_id = ? AND timestamp
+    BETWEEN ...`` excludes other students' chunks.
     """
 
     __tablename__ = "game_telemetry"
@@ -47,11 +51,11 @@ class GameTelemetry(Base, UUIDMixin):
         primary_key=False  # TimescaleDB uses composite primary key with timestamp
     )
     student_id: Mapped[str] = mapped_column(String(36), ForeignKey("students.id"), nullable=False, index=True)
-    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("game_sessions.id"), nullable=False, index=True)
-    event_type: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("game_sessions.id"), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
 
     # Event data (JSONB for flexible schema)
-    event_data: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    event_data: Mapped[Dict[str, Any]] = mapped_column(JSONDocument, nullable=False)
 
     # Optional contextual fields
     mission_id: Mapped[str] = mapped_column(String(100), nullable=True, index=True)
@@ -63,6 +67,8 @@ class GameTelemetry(Base, UUIDMixin):
     __table_args__ = (
         Index("idx_telemetry_student_timestamp", "student_id", "timestamp"),
         Index("idx_telemetry_event_type_timestamp", "event_type", "timestamp"),
+        # Also serves session_id lookups, replacing its single-column index
+        Index("idx_telemetry_session_ts", "session_id", "timestamp"),
     )
 
     def __repr__(self):
@@ -1,6 +1,6 @@
 """Student model."""
 
-from sqlalchemy import String, Integer, Boolean, ForeignKey, Date
+from sqlalchemy import String, Integer, Boolean, ForeignKey, Date, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import List, Optional
 from datetime import date
@@ -35,12 +35,19 @@ class Student(Base, UUIDMixin, TimestampMixin):
     user_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id"), nullable=True)
 
     # Relationships
+    # Per-student collections are unbounded, so loading them implicitly (one
+    # SELECT per student in a loop) raises; queries opt in with selectinload()
     school = relationship("School", back_populates="students")
     user = relationship("User")
-    game_sessions: Mapped[List["GameSession"]] = relationship("GameSession", back_populates="student")
-    audio_files: Mapped[List["AudioFile"]] = relationship("AudioFile", back_populates="student")
-    skill_assessments: Mapped[List["SkillAssessment"]] = relationship("SkillAssessment", back_populates="student")
-    rubric_assessments: Mapped[List["RubricAssessment"]] = relationship("RubricAssessment", back_populates="student")
+    game_sessions: Mapped[List["GameSession"]] = relationship("GameSession", back_populates="student", lazy="raise")
+    audio_files: Mapped[List["AudioFile"]] = relationship("AudioFile", back_populates="student", lazy="raise")
+    skill_assessments: Mapped[List["SkillAssessment"]] = relationship("SkillAssessment", back_populates="student", lazy="raise")
+    rubric_assessments: Mapped[List["RubricAssessment"]] = relationship("RubricAssessment", back_populates="student", lazy="raise")
+
+    # Covering index for school-scoped access checks (answered index-only)
+    __table_args__ = (
+        Index("idx_student_school_id_id", "school_id", "id"),
+    )
 
     def __repr__(self):
         return f"<Student {self.first_name} {self.last_name} (Grade {self.grade_level})>"
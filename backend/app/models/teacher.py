@@ -1,6 +1,6 @@
 """Teacher model."""
 
-from sqlalchemy import String, Boolean, ForeignKey, Table, Column
+from sqlalchemy import String, Boolean, ForeignKey, Table, Column, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import List
 
@@ -12,6 +12,8 @@ teacher_student_association = Table(
     Base.metadata,
     Column("teacher_id", String(36), ForeignKey("teachers.id"), primary_key=True),
     Column("student_id", String(36), ForeignKey("students.id"), primary_key=True),
+    # The PK covers teacher -> students; this covers student -> teachers
+    Index("idx_teacher_student_student_teacher", "student_id", "teacher_id"),
 )
 
 
@@ -28,7 +30,7 @@ class Teacher(Base, UUIDMixin, TimestampMixin):
 
     # Foreign keys
     school_id: Mapped[str] = mapped_column(String(36), ForeignKey("schools.id"), nullable=False, index=True)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
+    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
 
     # Relationships
     school = relationship("School", back_populates="teachers")
@@ -38,7 +40,7 @@ class Teacher(Base, UUIDMixin, TimestampMixin):
         secondary=teacher_student_association,
         backref="teachers",
     )
-    rubric_assessments: Mapped[List["RubricAssessment"]] = relationship("RubricAssessment", back_populates="teacher")
+    rubric_assessments: Mapped[List["RubricAssessment"]] = relationship("RubricAssessment", back_populates="teacher", lazy="raise")
 
     def __repr__(self):
         return f"<Teacher {self.first_name} {self.last_name}>"
@@ -1,10 +1,10 @@
 """Transcript model."""
 
-from sqlalchemy import String, ForeignKey, Text, Float, JSON
+from sqlalchemy import String, ForeignKey, Text, Float, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Dict, Any, List, Optional
 
-from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.base import Base, JSONDocument, TimestampMixin, UUIDMixin
 
 
 class Transcript(Base, UUIDMixin, TimestampMixin):
@@ -13,7 +13,7 @@ class Transcript(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "transcripts"
 
     audio_file_id: Mapped[str] = mapped_column(String(36), ForeignKey("audio_files.id"), nullable=False, unique=True)
-    student_id: Mapped[str] = mapped_column(String(36), ForeignKey("students.id"), nullable=False, index=True)
+    student_id: Mapped[str] = mapped_column(String(36), ForeignKey("students.id"), nullable=False)
 
     # Transcript content
     text: Mapped[str] = mapped_column(Text, nullable=False)
@@ -24,7 +24,7 @@ class Transcript(Base, UUIDMixin, TimestampMixin):
     language_code: Mapped[str] = mapped_column(String(10), nullable=False, default="en-US")
 
     # Word-level data (for timestamps and confidence)
-    word_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    word_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONDocument, nullable=True)
 
     # Relationships
     audio_file = relationship("AudioFile", back_populates="transcripts")
@@ -34,5 +34,12 @@ class Transcript(Base, UUIDMixin, TimestampMixin):
         uselist=False
     )
 
+    # Covers student_id lookups too, so student_id has no index of its own
+    __table_args__ = (
+        Index("idx_transcript_student_created", "student_id", "created_at"),
+        # Containment queries into the word-level document
+        Index("idx_transcript_word_data_gin", "word_data", postgresql_using="gin"),
+    )
+
     def __repr__(self):
         return f"<Transcript {self.id} ({self.word_count} words)>"
@@ -1,14 +1,14 @@
 """User authentication and authorization models."""
 
 import enum
-from sqlalchemy import Boolean, Enum, String, ForeignKey
+from sqlalchemy import Boolean, String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
 
 
-class UserRole(enum.Enum):
-    """User roles for RBAC."""
+class UserRole(str, enum.Enum):
+    """User roles for RBAC; ``User.role`` stores the ``.value`` strings."""
 
     STUDENT = "student"
     TEACHER = "teacher"
@@ -26,7 +26,9 @@ class User(Base, UUIDMixin, TimestampMixin):
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     first_name: Mapped[str] = mapped_column(String(100), nullable=False)
     last_name: Mapped[str] = mapped_column(String(100), nullable=False)
-    role: Mapped[UserRole] = mapped_column(Enum(UserRole), nullable=False, index=True)
+    # Plain string (a UserRole value): RBAC compares strings, so loading a
+    # user needs no enum lookup per row
+    role: Mapped[str] = mapped_column(String(20), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
@@ -36,5 +38,10 @@ class User(Base, UUIDMixin, TimestampMixin):
     # Relationships
     school = relationship("School", back_populates="users")
 
+    # Active users of a role within a school; replaces the role-only index
+    __table_args__ = (
+        Index("idx_user_school_role_active", "school_id", "role", "is_active"),
+    )
+
     def __repr__(self):
-        return f"<User {self.email} ({self.role.value})>"
+        return f"<User {self.email} ({self.role})>"
@@ -30,6 +30,22 @@ class EvidenceSchema(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, evidence) -> "EvidenceSchema":
+        """
+        Build from an Evidence row without running validation.
+
+        Only for rows loaded from our own database, whose columns already
+        enforce these types.
+        """
+        return cls.model_construct(
+            id=evidence.id,
+            evidence_type=evidence.evidence_type.value,
+            source=evidence.source,
+            content=evidence.content,
+            relevance_score=evidence.relevance_score,
+        )
+
 
 class AssessmentRequest(BaseModel):
     """Request to generate a skill assessment."""
@@ -75,6 +91,27 @@ class AssessmentResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, assessment) -> "AssessmentResponse":
+        """
+        Build from a SkillAssessment row and its evidence without validation.
+
+        Only for rows loaded from our own database; the evidence relationship
+        must already be loaded.
+        """
+        return cls.model_construct(
+            id=assessment.id,
+            student_id=assessment.student_id,
+            skill_type=assessment.skill_type.value,
+            score=assessment.score,
+            confidence=assessment.confidence,
+            reasoning=assessment.reasoning,
+            recommendations=assessment.recommendations,
+            evidence=[EvidenceSchema.from_orm_fast(e) for e in assessment.evidence],
+            created_at=assessment.created_at,
+            updated_at=assessment.updated_at,
+        )
+
 
 class BatchAssessmentResponse(BaseModel):
     """Response for batch assessment request."""
@@ -1,21 +1,78 @@
 """Pydantic schemas for telemetry validation."""
 
-from pydantic import BaseModel, Field, UUID4, field_validator, ConfigDict
-from typing import Dict, Any, List, Optional
+from pydantic import (
+    BaseModel,
+    Field,
+    UUID4,
+    field_validator,
+    ConfigDict,
+    StringConstraints,
+)
+from typing import Annotated, Dict, Any, List, Optional
 from datetime import datetime
+from json.encoder import encode_basestring_ascii as _encode_json_str
+
+# Constrained strings are checked inside pydantic-core, with no Python
+# validator call per value
+EventType = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True, min_length=1, max_length=100, pattern=r"^[a-z0-9_]+$"
+    ),
+]
+MissionId = Annotated[str, StringConstraints(strip_whitespace=True, max_length=100)]
+# Formats like "1", "1.0", "1.0.0" and "v1.2.3"
+GameVersion = Annotated[
+    str, StringConstraints(min_length=1, max_length=20, pattern=r"^v?\d+(\.\d+){0,2}$")
+]
+
+_MAX_EVENT_DATA_BYTES = 10000  # 10KB limit on an event's data payload
+MAX_BATCH_EVENTS = 1000
+
+
+def _estimate_json_size(value: Any, budget: int) -> int:
+    """
+    Measure the ``json.dumps`` size of value without building the output.
+
+    Strings are sized with the C ASCII escaper json itself uses, so escaped
+    quotes, backslashes and ``\\uXXXX`` sequences count in full; numbers,
+    booleans and None count their repr. Containers add brackets and the
+    default ", " / ": " separators. The walk stops as soon as the running
+    total exceeds budget, so past that point the result is only a lower
+    bound.
+    """
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            size += len(_encode_json_str(item))
+        elif isinstance(item, dict):
+            # Braces, ": " per entry and ", " between entries
+            size += 2 * len(item) + max(2 * len(item) - 2, 0) + 2
+            for key, child in item.items():
+                size += len(_encode_json_str(key if isinstance(key, str) else str(key)))
+                stack.append(child)
+        elif isinstance(item, (list, tuple)):
+            size += max(2 * len(item) - 2, 0) + 2
+            stack.extend(item)
+        else:
+            size += len(repr(item))
+        if size > budget:
+            break
+    return size
 
 
 class TelemetryEventCreate(BaseModel):
     """Schema for creating a single telemetry event."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
+    # Only event_type and mission_id are stripped, via their own constraints
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     event_id: UUID4 = Field(..., description="Unique event identifier")
     student_id: UUID4 = Field(..., description="Student identifier")
-    event_type: str = Field(
+    event_type: EventType = Field(
         ...,
-        min_length=1,
-        max_length=100,
         description="Type of event (e.g., mission_start, choice_made)",
     )
     timestamp: datetime = Field(..., description="Event timestamp (UTC)")
@@ -23,69 +80,37 @@ class TelemetryEventCreate(BaseModel):
         default_factory=dict, description="Event-specific data"
     )
     session_id: UUID4 = Field(..., description="Game session identifier")
-    mission_id: Optional[str] = Field(
-        None, max_length=100, description="Mission identifier if applicable"
+    mission_id: Optional[MissionId] = Field(
+        None, description="Mission identifier if applicable"
     )
-    game_version: str = Field(
-        default="1.0.0", max_length=20, description="Game version"
-    )
-
-    @field_validator("event_type")
-    @classmethod
-    def validate_event_type(cls, v: str) -> str:
-        """Validate event_type contains only lowercase letters and underscores."""
-        if not v.replace("_", "").isalnum():
-            raise ValueError(
-                "event_type must contain only alphanumeric characters and underscores"
-            )
-        if not v.islower():
-            raise ValueError("event_type must be lowercase")
-        return v
+    game_version: GameVersion = Field(default="1.0.0", description="Game version")
 
     @field_validator("data")
     @classmethod
     def validate_data_size(cls, v: Dict[str, Any]) -> Dict[str, Any]:
         """Validate event_data is not too large."""
-        import json
-
-        data_size = len(json.dumps(v))
-        if data_size > 10000:  # 10KB limit
-            raise ValueError(f"event_data too large: {data_size} bytes (max 10KB)")
-        return v
-
-    @field_validator("game_version")
-    @classmethod
-    def validate_version_format(cls, v: str) -> str:
-        """Validate game version follows semver-like pattern."""
-        if not v or len(v) > 20:
-            raise ValueError("game_version must be 1-20 characters")
-        # Basic version validation (allows formats like "1.0.0", "1.0", "v1.2.3")
+        if _estimate_json_size(v, _MAX_EVENT_DATA_BYTES) > _MAX_EVENT_DATA_BYTES:
+            raise ValueError("event_data too large (max 10KB)")
         return v
 
 
 class TelemetryBatchCreate(BaseModel):
     """Schema for creating a batch of telemetry events."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
+    # validate_json parses the whole body before max_length is checked, so this
+    # limit does not bound the work; the endpoint's _MAX_BATCH_BODY_BYTES cap on
+    # the streamed body does
     events: List[TelemetryEventCreate] = Field(
-        ..., description="List of telemetry events"
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_EVENTS,
+        description="List of telemetry events",
     )
     batch_id: UUID4 = Field(..., description="Batch identifier")
     client_version: str = Field(..., max_length=20, description="Game client version")
 
-    @field_validator("events")
-    @classmethod
-    def validate_batch_size(
-        cls, v: List[TelemetryEventCreate]
-    ) -> List[TelemetryEventCreate]:
-        """Validate batch is not too large."""
-        if len(v) > 1000:
-            raise ValueError(f"Batch too large: {len(v)} events (max 1000)")
-        if len(v) == 0:
-            raise ValueError("Batch must contain at least one event")
-        return v
-
 
 class SessionCloseRequest(BaseModel):
     """Schema for closing a game session."""
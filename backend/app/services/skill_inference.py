@@ -2,7 +2,6 @@
 
 import logging
 import os
-import joblib
 import numpy as np
 import xgboost as xgb
 from typing import Dict, Any, List, Optional, Tuple
@@ -14,10 +13,23 @@ import uuid
 from app.models.assessment import SkillType, SkillAssessment
 from app.models.features import LinguisticFeatures, BehavioralFeatures
 from app.models.student import Student
-from app.ml.model_metadata import ModelRegistry
+from app.ml.model_metadata import (
+    ModelRegistry,
+    load_feature_names,
+    load_model_file,
+    model_artifact_paths,
+)
 
 logger = logging.getLogger(__name__)
 
+# Optional runtime for models compiled with ``train_models.py --compile``
+try:
+    import tl2cgen
+
+    TL2CGEN_AVAILABLE = True
+except ImportError:
+    TL2CGEN_AVAILABLE = False
+
 # Feature dimensions constants
 NUM_LINGUISTIC_FEATURES = 16
 NUM_BEHAVIORAL_FEATURES = 9
@@ -40,6 +52,8 @@ class SkillInferenceService:
         self.models_dir = Path(models_dir or os.getenv("MODELS_DIR", "./models"))
         self.models: Dict[SkillType, Any] = {}
         self.feature_names: Dict[SkillType, List[str]] = {}
+        # Compiled predictors used for point predictions when available
+        self.compiled_models: Dict[SkillType, Any] = {}
 
         # Initialize model registry for version tracking
         self.registry = ModelRegistry(models_dir=str(self.models_dir))
@@ -63,16 +77,17 @@ class SkillInferenceService:
     def _load_models(self):
         """Load trained XGBoost models from disk with validation."""
         for skill_type in self.skill_types:
-            model_path = self.models_dir / f"{skill_type.value}_model.pkl"
-            features_path = self.models_dir / f"{skill_type.value}_features.pkl"
+            model_path, features_path = model_artifact_paths(
+                self.models_dir, skill_type.value
+            )
 
             if model_path.exists():
                 try:
-                    model = joblib.load(model_path)
+                    model = load_model_file(model_path)
 
                     # Load feature names if available
                     if features_path.exists():
-                        feature_names = joblib.load(features_path)
+                        feature_names = load_feature_names(features_path)
 
                         # Validate feature count matches expected dimensions
                         if len(feature_names) != EXPECTED_FEATURE_COUNT:
@@ -94,6 +109,19 @@ class SkillInferenceService:
                     # Store model after validation
                     self.models[skill_type] = model
 
+                    # Prefer a compiled library built from this exact model
+                    compiled_path = self.models_dir / f"{skill_type.value}_model.so"
+                    if (
+                        TL2CGEN_AVAILABLE
+                        and compiled_path.exists()
+                        and compiled_path.stat().st_mtime_ns
+                        >= model_path.stat().st_mtime_ns
+                    ):
+                        self.compiled_models[skill_type] = tl2cgen.Predictor(
+                            str(compiled_path)
+                        )
+                        logger.info(f"Loaded compiled model for {skill_type.value}")
+
                     # Log version info if available
                     version = self.registry.get_model_version(skill_type.value)
                     if version:
@@ -247,7 +275,7 @@ class SkillInferenceService:
                     booster = model.get_booster()
                     # Predict with each tree individually
                     tree_preds = []
-                    for tree_idx in range(model.n_estimators):
+                    for tree_idx in range(booster.num_boosted_rounds()):
                         pred = booster.predict(
                             dmatrix,
                             iteration_range=(tree_idx, tree_idx + 1),
@@ -437,7 +465,11 @@ class SkillInferenceService:
 
         # Make prediction
         model = self.models[skill_type]
-        prediction = model.predict(features)[0]
+        compiled = self.compiled_models.get(skill_type)
+        if compiled is not None:
+            prediction = compiled.predict(tl2cgen.DMatrix(features)).ravel()[0]
+        else:
+            prediction = model.predict(features)[0]
 
         # Ensure score is in 0-1 range
         score = float(np.clip(prediction, 0.0, 1.0))
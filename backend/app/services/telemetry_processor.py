@@ -2,16 +2,18 @@
 
 import logging
 import time
+from collections import Counter
 from typing import Dict, Any, List
 from datetime import datetime, timezone
 from uuid import uuid4
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from app.models.game_telemetry import GameSession, GameTelemetry
 from app.models.features import BehavioralFeatures
 from app.core.metrics import (
-    telemetry_events_total,
+    telemetry_event_counter,
     telemetry_processing_time,
     telemetry_batch_size,
     telemetry_duplicates_total,
@@ -19,6 +21,22 @@ from app.core.metrics import (
 
 logger = logging.getLogger(__name__)
 
+# Column order for COPY-based bulk ingestion
+_TELEMETRY_COPY_COLUMNS = (
+    "id",
+    "timestamp",
+    "student_id",
+    "session_id",
+    "event_type",
+    "event_data",
+    "mission_id",
+    "choice_made",
+)
+
+# COPY costs an extra round trip to look up column types, so small batches
+# go through a single multi-row INSERT instead
+_COPY_MIN_ROWS = 100
+
 
 class TelemetryProcessor:
     """Process and store game telemetry events."""
@@ -96,13 +114,13 @@ class TelemetryProcessor:
             )
 
             # Record metrics
-            telemetry_events_total.labels(event_type=event_type, status="success").inc()
+            telemetry_event_counter(event_type, "success").inc()
             telemetry_processing_time.observe(time.time() - start_time)
 
             return telemetry
         except Exception as e:
             # Record failure metric
-            telemetry_events_total.labels(event_type=event_type, status="failure").inc()
+            telemetry_event_counter(event_type, "failure").inc()
             raise
 
     async def process_batch(
@@ -150,6 +168,114 @@ class TelemetryProcessor:
 
         return telemetry_events
 
+    async def bulk_ingest(
+        self,
+        events: List[Dict[str, Any]],
+        batch_id: str,
+    ) -> int:
+        """
+        Store a batch of telemetry events in one bulk write.
+
+        Duplicates (already stored or repeated within the batch) are skipped
+        after a single lookup. On asyncpg, batches of more than
+        _COPY_MIN_ROWS rows are streamed with a binary ``COPY``; smaller
+        batches and other drivers use one executemany INSERT.
+        Unlike process_batch the batch is all-or-nothing.
+
+        Args:
+            events: List of event dictionaries (same shape as process_batch)
+            batch_id: Batch identifier
+
+        Returns:
+            Number of events accepted: those stored now plus duplicates that
+            were already stored, so a retried batch reports the same count
+            as the original (as process_batch did)
+        """
+        start_time = time.time()
+        telemetry_batch_size.observe(len(events))
+
+        event_ids = [event["event_id"] for event in events if event.get("event_id")]
+        seen = set()
+        if event_ids:
+            result = await self.db.execute(
+                select(GameTelemetry.id).where(GameTelemetry.id.in_(event_ids))
+            )
+            seen.update(result.scalars())
+
+        now = datetime.now(timezone.utc)
+        rows = []
+        for event in events:
+            event_id = event.get("event_id")
+            if event_id in seen:
+                continue
+            if event_id:
+                seen.add(event_id)
+
+            event_type = event.get("event_type")
+            event_data = event.get("data", {})
+            rows.append(
+                {
+                    "id": event_id or str(uuid4()),
+                    "timestamp": event.get("timestamp") or now,
+                    "student_id": event.get("student_id"),
+                    "session_id": event.get("session_id"),
+                    "event_type": event_type,
+                    "event_data": event_data,
+                    "mission_id": event.get("mission_id"),
+                    "choice_made": (
+                        event_data.get("choice")
+                        if event_type == "choice_made"
+                        else None
+                    ),
+                }
+            )
+
+        duplicates = len(events) - len(rows)
+        if duplicates:
+            logger.info(f"Ignored {duplicates} duplicate events in batch {batch_id}")
+            telemetry_duplicates_total.inc(duplicates)
+
+        event_types = Counter(row["event_type"] for row in rows)
+        try:
+            if rows:
+                conn = await self.db.connection()
+                if conn.dialect.driver == "asyncpg" and len(rows) > _COPY_MIN_ROWS:
+                    raw = await conn.get_raw_connection()
+                    records = [
+                        tuple(
+                            (
+                                orjson.dumps(row[col]).decode()
+                                if col == "event_data"
+                                else row[col]
+                            )
+                            for col in _TELEMETRY_COPY_COLUMNS
+                        )
+                        for row in rows
+                    ]
+                    await raw.driver_connection.copy_records_to_table(
+                        GameTelemetry.__tablename__,
+                        records=records,
+                        columns=_TELEMETRY_COPY_COLUMNS,
+                    )
+                else:
+                    await self.db.execute(insert(GameTelemetry), rows)
+
+            await self.db.commit()
+        except Exception:
+            for event_type, count in event_types.items():
+                telemetry_event_counter(event_type, "failure").inc(count)
+            raise
+
+        for event_type, count in event_types.items():
+            telemetry_event_counter(event_type, "success").inc(count)
+        telemetry_processing_time.observe(time.time() - start_time)
+
+        logger.info(
+            f"Bulk ingested batch {batch_id}: {len(rows)}/{len(events)} events stored"
+        )
+
+        return len(rows) + duplicates
+
     async def get_or_create_session(
         self,
         student_id: str,
@@ -93,6 +93,23 @@ class TranscriptionService:
             logger.error(f"Failed to upload audio to GCS: {str(e)}")
             raise
 
+    async def delete_audio_from_gcs(self, gcs_file_name: str) -> None:
+        """Delete an audio file from Google Cloud Storage.
+
+        Args:
+            gcs_file_name: Filename of the object in GCS
+        """
+        try:
+            bucket = self.storage_client.bucket(self.audio_bucket_name)
+            bucket.blob(gcs_file_name).delete()
+            logger.info(
+                f"Deleted audio file gs://{self.audio_bucket_name}/{gcs_file_name}"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to delete audio from GCS: {str(e)}")
+            raise
+
     async def transcribe_audio(self, gcs_uri: str) -> Dict[str, Any]:
         """Transcribe audio file from Cloud Storage.
 
@@ -37,6 +37,7 @@ class SkillAutoLabeler:
         """
         self.use_openai = use_openai
         self.model = model
+        self.rng = np.random.default_rng()
 
         if use_openai:
             try:
@@ -182,7 +183,7 @@ Your score (number only):"""
         grade_adjustment = (grade - 5) * 0.02  # +/- 0.06 for grades 2-8
 
         # Add some randomness for realistic variance
-        score = np.random.uniform(base_min, base_max) + grade_adjustment
+        score = self.rng.uniform(base_min, base_max) + grade_adjustment
 
         # Slight adjustments based on response characteristics
         word_count = len(response.split())
@@ -254,11 +255,11 @@ Your score (number only):"""
                     # Secondary skills - assign baseline scores with variance
                     # These should be lower and more neutral
                     if skill_level == "high":
-                        score = np.random.uniform(0.50, 0.65)
+                        score = self.rng.uniform(0.50, 0.65)
                     elif skill_level == "medium":
-                        score = np.random.uniform(0.40, 0.55)
+                        score = self.rng.uniform(0.40, 0.55)
                     else:
-                        score = np.random.uniform(0.30, 0.50)
+                        score = self.rng.uniform(0.30, 0.50)
 
                 score_columns[score_col].append(round(score, 3))
 
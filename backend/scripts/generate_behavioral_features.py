@@ -40,7 +40,6 @@ class BehavioralFeatureGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        np.random.seed(seed)
         self.rng = np.random.default_rng(seed)
 
     def generate_features(
@@ -34,12 +34,14 @@ async def setup_timescaledb():
         await conn.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb CASCADE;"))
         logger.info("✓ TimescaleDB extension enabled")
 
-        # Convert game_telemetry to hypertable
+        # Convert game_telemetry to hypertable (time + student_id hash partitions)
         try:
             await conn.execute(text("""
                 SELECT create_hypertable(
                     'game_telemetry',
                     'timestamp',
+                    partitioning_column => 'student_id',
+                    number_partitions => 16,
                     if_not_exists => TRUE,
                     migrate_data => TRUE
                 );
@@ -172,7 +172,10 @@ def calculate_irr_metrics(
 
 
 def calculate_feature_correlations(
-    features: pd.DataFrame, ground_truth: Dict[int, Dict[str, float]], skills: List[str]
+    features: pd.DataFrame,
+    ground_truth: Dict[int, Dict[str, float]],
+    skills: List[str],
+    seed: int = 42,
 ) -> Dict[str, Dict]:
     """
     Calculate correlation between features and ground truth.
@@ -181,10 +184,12 @@ def calculate_feature_correlations(
         features: Extracted features DataFrame
         ground_truth: Ground truth scores
         skills: List of skill names
+        seed: Seed for the random baseline used when a skill has no feature
 
     Returns:
         Dict with correlation metrics per skill
     """
+    rng = np.random.default_rng(seed)
     results = {}
 
     for skill in skills:
@@ -199,7 +204,7 @@ def calculate_feature_correlations(
             pred_scores = features[feature_col].values
         else:
             # Fallback: use random baseline
-            pred_scores = np.random.uniform(0.3, 0.8, len(gt_scores))
+            pred_scores = rng.uniform(0.3, 0.8, len(gt_scores))
 
         # Calculate correlation
         correlation, p_value = pearsonr(gt_scores, pred_scores)
@@ -505,13 +510,14 @@ def main():
     skills = list(ground_truth[0].keys())
 
     # Generate synthetic feature predictions with realistic correlation
+    rng = np.random.default_rng(42)
     features_data = []
     for student_id in ground_truth.keys():
         row = {"student_id": student_id}
         for skill in skills:
             # Add some realistic noise to create correlation ~0.70
             true_score = ground_truth[student_id][skill]
-            noise = np.random.normal(0, 0.15)
+            noise = rng.normal(0, 0.15)
             pred_score = np.clip(true_score + noise, 0, 1)
             row[f"{skill}_score"] = pred_score
         features_data.append(row)
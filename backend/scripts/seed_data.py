@@ -143,7 +143,7 @@ async def seed_teachers(session: AsyncSession, schools: list[School]) -> list[Te
             email=data["email"],
             first_name=data["first_name"],
             last_name=data["last_name"],
-            role=UserRole.TEACHER,
+            role=UserRole.TEACHER.value,
             school_id=data["school"].id,
             password_hash="$2b$12$test_hashed_password_for_seeding",  # Not for production!
         )
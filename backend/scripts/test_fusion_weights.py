@@ -29,7 +29,6 @@ class SyntheticEvidenceGenerator:
 
     def __init__(self, seed: int = 42):
         """Initialize generator."""
-        np.random.seed(seed)
         self.rng = np.random.default_rng(seed)
         self.skills = [
             "empathy",
@@ -120,9 +119,10 @@ class SyntheticEvidenceGenerator:
 class FusionWeightOptimizer:
     """Test and optimize fusion weights."""
 
-    def __init__(self, skills: List[str]):
+    def __init__(self, skills: List[str], seed: int = 42):
         """Initialize optimizer."""
         self.skills = skills
+        self.rng = np.random.default_rng(seed)
         self.sources = ["transcript", "game", "teacher"]
 
     def fuse_scores(
@@ -293,7 +293,7 @@ class FusionWeightOptimizer:
 
         for _ in range(n_trials):
             # Generate random weights that sum to 1.0
-            weights_array = np.random.dirichlet([1, 1, 1])
+            weights_array = self.rng.dirichlet([1, 1, 1])
             weights = {
                 "transcript": float(weights_array[0]),
                 "game": float(weights_array[1]),
@@ -191,7 +191,7 @@ async def test_user(db_session, test_school):
         password_hash="$2b$12$test_hashed_password",  # Dummy bcrypt hash
         first_name="Test",
         last_name="Teacher",
-        role=UserRole.TEACHER,
+        role=UserRole.TEACHER.value,
         school_id=test_school.id,
     )
     db_session.add(user)
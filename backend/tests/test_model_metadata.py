@@ -0,0 +1,99 @@
+"""Tests for the model registry and on-disk model formats."""
+
+import hashlib
+import os
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from app.ml.model_metadata import ModelRegistry
+
+
+def _register(registry: ModelRegistry, skill_type: str = "empathy") -> None:
+    """Register the skill's model file with placeholder metadata."""
+    registry.register_model(
+        skill_type=skill_type,
+        version="1.0.0",
+        model_type="XGBRegressor",
+        hyperparameters={},
+        performance_metrics={},
+        feature_count=3,
+        training_samples=10,
+    )
+
+
+class TestModelRegistryIntegrity:
+    """Test verify_model_integrity's stat shortcut and checksum fallback."""
+
+    @pytest.fixture
+    def model_path(self, tmp_path):
+        path = tmp_path / "empathy_model.pkl"
+        path.write_bytes(b"model bytes")
+        return path
+
+    @pytest.mark.parametrize("hash_algo", ["blake2b", "sha256"])
+    def test_unchanged_file_skips_hash(self, tmp_path, model_path, hash_algo):
+        """A file whose size and mtime match is trusted without rehashing."""
+        registry = ModelRegistry(models_dir=str(tmp_path), hash_algo=hash_algo)
+        _register(registry)
+
+        with patch.object(registry, "_calculate_checksum") as checksum:
+            assert registry.verify_model_integrity("empathy")
+        checksum.assert_not_called()
+
+    def test_touched_file_rehashes_and_records_stat(self, tmp_path, model_path):
+        """Same content with a new mtime passes and the new stat is saved."""
+        registry = ModelRegistry(models_dir=str(tmp_path))
+        _register(registry)
+        new_mtime_ns = model_path.stat().st_mtime_ns + 5_000_000_000
+        os.utime(model_path, ns=(new_mtime_ns, new_mtime_ns))
+
+        with patch.object(
+            registry, "_calculate_checksum", wraps=registry._calculate_checksum
+        ) as checksum:
+            assert registry.verify_model_integrity("empathy")
+        checksum.assert_called_once()
+
+        reloaded = ModelRegistry(models_dir=str(tmp_path))
+        assert reloaded.get_model_metadata("empathy").mtime_ns == new_mtime_ns
+
+    def test_changed_content_fails(self, tmp_path, model_path):
+        """Different content fails even when the size is unchanged."""
+        registry = ModelRegistry(models_dir=str(tmp_path))
+        _register(registry)
+        model_path.write_bytes(b"MODEL BYTES")
+
+        assert not registry.verify_model_integrity("empathy")
+
+    def test_missing_file_fails(self, tmp_path, model_path):
+        """A deleted model file fails verification."""
+        registry = ModelRegistry(models_dir=str(tmp_path))
+        _register(registry)
+        model_path.unlink()
+
+        assert not registry.verify_model_integrity("empathy")
+
+    def test_legacy_entry_verifies_with_sha256(self, tmp_path, model_path):
+        """Entries written before stat and hash_algo fields verify as SHA-256."""
+        legacy = {
+            "empathy": {
+                "skill_type": "empathy",
+                "version": "0.9.0",
+                "training_date": "2025-01-01T00:00:00",
+                "model_type": "XGBRegressor",
+                "hyperparameters": {},
+                "performance_metrics": {},
+                "feature_count": 3,
+                "training_samples": 10,
+                "model_checksum": hashlib.sha256(b"model bytes").hexdigest(),
+            }
+        }
+        (tmp_path / "model_registry.json").write_bytes(orjson.dumps(legacy))
+
+        registry = ModelRegistry(models_dir=str(tmp_path))
+
+        assert registry.get_model_metadata("empathy").hash_algo == "sha256"
+        assert registry.verify_model_integrity("empathy")
+        # The stat is recorded so the next check can skip the hash
+        assert registry.get_model_metadata("empathy").size_bytes == len(b"model bytes")
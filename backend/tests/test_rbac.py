@@ -0,0 +1,268 @@
+"""Tests for role-based access control helpers."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pandas as pd
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core import rbac
+from app.core.rbac import (
+    ACCESS_CACHE_TTL_SECONDS,
+    _access_key,
+    _cached_access,
+    anonymize_dataframe,
+    anonymize_student_data,
+    filter_accessible_students,
+    is_in_teacher_class,
+)
+from app.models.school import School
+from app.models.student import Student
+from app.models.teacher import teacher_student_association
+
+
+async def _add_student(db_session, school_id):
+    """Insert another student in the given school."""
+    student = Student(
+        id=str(uuid.uuid4()),
+        first_name="Other",
+        last_name="Student",
+        grade_level=5,
+        school_id=school_id,
+    )
+    db_session.add(student)
+    await db_session.flush()
+    return student
+
+
+async def _assign(db_session, teacher, student):
+    """Link a student to a teacher through teacher_student."""
+    await db_session.execute(
+        teacher_student_association.insert().values(
+            teacher_id=teacher.id, student_id=student.id
+        )
+    )
+
+
+class _FakeRedis:
+    """In-memory stand-in for the async Redis client used by the access cache."""
+
+    def __init__(self, fail: bool = False):
+        self.store = {}
+        self.ttls = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise RedisConnectionError("redis down")
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise RedisConnectionError("redis down")
+        self.store[key] = value
+        self.ttls[key] = ex
+
+
+class TestCachedAccess:
+    """Test the Redis-backed access decision cache."""
+
+    @pytest.fixture
+    def fake_redis(self, monkeypatch):
+        cache = _FakeRedis()
+        monkeypatch.setattr(rbac, "_get_access_cache", lambda: cache)
+        return cache
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cached, expected", [(b"1", True), (b"0", False)])
+    async def test_cached_decision_skips_check(self, fake_redis, cached, expected):
+        """Cached allow and deny decisions are served without the DB check."""
+        fake_redis.store["rbac:key"] = cached
+        check = AsyncMock(return_value=not expected)
+
+        assert await _cached_access("rbac:key", check) is expected
+        check.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("allowed, stored", [(True, b"1"), (False, b"0")])
+    async def test_miss_runs_check_and_stores(self, fake_redis, allowed, stored):
+        """A miss runs the check and caches its result with the TTL."""
+        check = AsyncMock(return_value=allowed)
+
+        assert await _cached_access("rbac:key", check) is allowed
+        check.assert_awaited_once()
+        assert fake_redis.store["rbac:key"] == stored
+        assert fake_redis.ttls["rbac:key"] == ACCESS_CACHE_TTL_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_check(self, monkeypatch):
+        """Redis failures fall back to the database check."""
+        monkeypatch.setattr(rbac, "_get_access_cache", lambda: _FakeRedis(fail=True))
+        check = AsyncMock(return_value=True)
+
+        assert await _cached_access("rbac:key", check) is True
+        check.assert_awaited_once()
+
+    def test_key_changes_with_role_and_school(self):
+        """Role or school changes never reuse an earlier decision."""
+        user = SimpleNamespace(id="u", role="teacher", school_id="s1")
+        key = _access_key(user, "student")
+
+        assert key != _access_key(
+            SimpleNamespace(id="u", role="school_admin", school_id="s1"), "student"
+        )
+        assert key != _access_key(
+            SimpleNamespace(id="u", role="teacher", school_id="s2"), "student"
+        )
+        # Per-user invalidation still matches every key for the user
+        assert key.startswith(f"{rbac.ACCESS_CACHE_PREFIX}:u:")
+
+
+class TestIsInTeacherClass:
+    """Test the teacher-to-student relationship check."""
+
+    @pytest.mark.asyncio
+    async def test_assigned_student(
+        self, db_session, test_user, test_teacher, test_student
+    ):
+        """A student linked to the teacher is accessible."""
+        await _assign(db_session, test_teacher, test_student)
+
+        assert await is_in_teacher_class(test_user.id, test_student.id, db_session)
+
+    @pytest.mark.asyncio
+    async def test_unassigned_student(
+        self, db_session, test_school, test_user, test_teacher, test_student
+    ):
+        """Students not linked to the teacher are denied."""
+        await _assign(db_session, test_teacher, test_student)
+        other = await _add_student(db_session, test_school.id)
+
+        assert not await is_in_teacher_class(test_user.id, other.id, db_session)
+
+    @pytest.mark.asyncio
+    async def test_other_user(self, db_session, test_teacher, test_student):
+        """The link only grants access to the teacher's own user account."""
+        await _assign(db_session, test_teacher, test_student)
+
+        assert not await is_in_teacher_class(
+            str(uuid.uuid4()), test_student.id, db_session
+        )
+
+
+class TestFilterAccessibleStudents:
+    """Test the batched student filter for each role."""
+
+    @pytest.mark.asyncio
+    async def test_system_admin_keeps_all(self, db_session):
+        """System admins keep every id, in caller order."""
+        user = SimpleNamespace(id="u", role="system_admin", school_id="s")
+        ids = ["c", "a", "b"]
+
+        assert await filter_accessible_students(user, ids, db_session) == ids
+
+    @pytest.mark.asyncio
+    async def test_student_keeps_own_id(self, db_session):
+        """Students only keep their own id."""
+        user = SimpleNamespace(id="u", role="student", student_id="b")
+
+        result = await filter_accessible_students(user, ["a", "b", "c"], db_session)
+
+        assert result == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_parent_and_researcher_get_nothing(self, db_session, test_student):
+        """Parents (no relation yet) and researchers get no students."""
+        for role in ("parent", "researcher"):
+            user = SimpleNamespace(id="u", role=role, school_id="s")
+            assert (
+                await filter_accessible_students(user, [test_student.id], db_session)
+                == []
+            )
+
+    @pytest.mark.asyncio
+    async def test_teacher_keeps_assigned_in_order(
+        self, db_session, test_school, test_user, test_teacher
+    ):
+        """Teachers keep their assigned students, in caller order."""
+        first = await _add_student(db_session, test_school.id)
+        second = await _add_student(db_session, test_school.id)
+        unassigned = await _add_student(db_session, test_school.id)
+        await _assign(db_session, test_teacher, first)
+        await _assign(db_session, test_teacher, second)
+        ids = [second.id, unassigned.id, first.id]
+
+        result = await filter_accessible_students(test_user, ids, db_session)
+
+        assert result == [second.id, first.id]
+
+    @pytest.mark.asyncio
+    async def test_school_admin_keeps_own_school_in_order(
+        self, db_session, test_school
+    ):
+        """School admins keep students of their school, in caller order."""
+        other_school = School(
+            id=str(uuid.uuid4()),
+            name="Other School",
+            district="Other District",
+            city="Other City",
+            state="CA",
+            zip_code="54321",
+        )
+        db_session.add(other_school)
+        await db_session.flush()
+        first = await _add_student(db_session, test_school.id)
+        second = await _add_student(db_session, test_school.id)
+        elsewhere = await _add_student(db_session, other_school.id)
+        user = SimpleNamespace(id="u", role="school_admin", school_id=test_school.id)
+        ids = [second.id, elsewhere.id, "missing", first.id]
+
+        result = await filter_accessible_students(user, ids, db_session)
+
+        assert result == [second.id, first.id]
+
+
+class TestAnonymizeDataframe:
+    """Test column-oriented anonymization against the per-record helper."""
+
+    def test_matches_anonymize_student_data(self):
+        """Each row matches anonymize_student_data on the same record."""
+        records = [
+            {
+                "id": "student-1",
+                "name": "Ada Lovelace",
+                "grade_level": 7,
+                "parent_email": "parent1@example.com",
+            },
+            {
+                "id": "student-2",
+                "name": "Alan Turing",
+                "grade_level": 8,
+                "parent_email": "parent2@example.com",
+            },
+            # Repeated id hashes to the same anonymous_id
+            {
+                "id": "student-1",
+                "name": "Ada Lovelace",
+                "grade_level": 7,
+                "parent_email": "parent1@example.com",
+            },
+        ]
+        df = pd.DataFrame(records)
+
+        result = anonymize_dataframe(df)
+
+        expected = [anonymize_student_data(record) for record in records]
+        assert result.to_dict(orient="records") == expected
+        # Input is left untouched
+        assert list(df.columns) == list(records[0])
+
+    def test_without_id_column(self):
+        """Frames without an id column only lose their PII columns."""
+        df = pd.DataFrame([{"name": "Ada Lovelace", "grade_level": 7}])
+
+        result = anonymize_dataframe(df)
+
+        assert result.to_dict(orient="records") == [{"grade_level": 7}]
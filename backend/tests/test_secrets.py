@@ -0,0 +1,93 @@
+"""Tests for secret resolution and caching."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.secrets import SecretManager
+
+
+def _gcp_manager(fetch) -> SecretManager:
+    """SecretManager whose GCP lookups are served by ``fetch``."""
+    manager = SecretManager(use_gcp=False)
+    manager.use_gcp = True
+    manager._get_secret_from_gcp = fetch
+    return manager
+
+
+class TestSecretManagerCache:
+    """Test the per-key double-checked secret cache."""
+
+    def test_concurrent_first_reads_make_one_gcp_call(self):
+        """Threads racing on one cold secret share a single GCP call."""
+        calls = []
+
+        def fetch(secret_name, version="latest"):
+            calls.append(secret_name)
+            time.sleep(0.05)
+            return "value"
+
+        manager = _gcp_manager(fetch)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: manager.get_secret("api-key"), range(8)))
+
+        assert results == ["value"] * 8
+        assert calls == ["api-key"]
+
+    def test_different_secrets_load_in_parallel(self):
+        """A cold lookup does not block cold lookups of other secrets."""
+        barrier = threading.Barrier(2, timeout=2)
+
+        def fetch(secret_name, version="latest"):
+            # Both loads must be in flight at once to pass the barrier
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                return "serialized"
+            return "parallel"
+
+        manager = _gcp_manager(fetch)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(manager.get_secret, ["first", "second"]))
+
+        assert results == ["parallel", "parallel"]
+
+    def test_miss_skips_gcp_but_rechecks_environment(self, monkeypatch):
+        """A secret found nowhere is not refetched from GCP on every read."""
+        calls = []
+
+        def fetch(secret_name, version="latest"):
+            calls.append(secret_name)
+            return None
+
+        monkeypatch.delenv("LATE_SECRET", raising=False)
+        manager = _gcp_manager(fetch)
+
+        def read(**kwargs):
+            return manager.get_secret(
+                "late-secret", env_var_name="LATE_SECRET", **kwargs
+            )
+
+        assert read(default="fallback") == "fallback"
+        assert read() is None
+        assert calls == ["late-secret"]
+
+        monkeypatch.setenv("LATE_SECRET", "from-env")
+        assert read() == "from-env"
+        assert calls == ["late-secret"]
+
+    def test_clear_cache_forgets_values_and_misses(self):
+        """clear_cache makes the next read go back to GCP."""
+        calls = []
+
+        def fetch(secret_name, version="latest"):
+            calls.append(secret_name)
+            return None if len(calls) == 1 else "rotated"
+
+        manager = _gcp_manager(fetch)
+        assert manager.get_secret("rotating") is None
+
+        manager.clear_cache()
+
+        assert manager.get_secret("rotating") == "rotated"
+        assert calls == ["rotating", "rotating"]
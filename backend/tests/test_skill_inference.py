@@ -5,6 +5,8 @@ import numpy as np
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 import joblib
+import orjson
+import xgboost as xgb
 
 from app.services.skill_inference import SkillInferenceService
 from app.models.assessment import SkillType
@@ -58,6 +60,39 @@ class TestSkillInferenceService:
         assert SkillType.EMPATHY in service.models
         assert SkillType.PROBLEM_SOLVING in service.models
 
+    def test_native_model_preferred_over_pickle(self, tmp_path):
+        """A .ubj model and JSON feature list win over legacy pickles."""
+        models_dir = tmp_path / "models"
+        models_dir.mkdir()
+
+        # Legacy pickles for both skills
+        for skill_type in [SkillType.EMPATHY, SkillType.PROBLEM_SOLVING]:
+            joblib.dump(
+                MockModel(n_features=26), models_dir / f"{skill_type.value}_model.pkl"
+            )
+            joblib.dump(
+                [f"legacy_{i}" for i in range(26)],
+                models_dir / f"{skill_type.value}_features.pkl",
+            )
+
+        # Native booster and feature list next to empathy's pickles
+        rng = np.random.default_rng(0)
+        booster = xgb.XGBRegressor(n_estimators=2, max_depth=2)
+        booster.fit(rng.random((20, 26)), rng.random(20))
+        booster.save_model(models_dir / "empathy_model.ubj")
+        native_names = [f"native_{i}" for i in range(26)]
+        (models_dir / "empathy_features.json").write_bytes(orjson.dumps(native_names))
+
+        service = SkillInferenceService(models_dir=str(models_dir))
+
+        assert isinstance(service.models[SkillType.EMPATHY], xgb.XGBRegressor)
+        assert service.feature_names[SkillType.EMPATHY] == native_names
+        # Skills with only pickles still load them
+        assert isinstance(service.models[SkillType.PROBLEM_SOLVING], MockModel)
+        assert service.feature_names[SkillType.PROBLEM_SOLVING] == [
+            f"legacy_{i}" for i in range(26)
+        ]
+
     def test_feature_vector_extraction(self, service):
         """Test feature vector extraction."""
         # Create mock features
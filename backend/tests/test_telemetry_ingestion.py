@@ -1,13 +1,42 @@
 """Tests for telemetry ingestion and processing."""
 
+import json
+
+import orjson
 import pytest
 from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
-from sqlalchemy import select
+from pydantic import ValidationError
+from sqlalchemy import func, select
 from httpx import AsyncClient
 
 from app.models.features import BehavioralFeatures
-from app.services.telemetry_processor import TelemetryProcessor
+from app.api.endpoints.telemetry import _MAX_BATCH_BODY_BYTES
+from app.models.game_telemetry import GameTelemetry
+from app.schemas.telemetry import (
+    MAX_BATCH_EVENTS,
+    TelemetryEventCreate,
+    _estimate_json_size,
+)
+from app.services.telemetry_processor import (
+    _COPY_MIN_ROWS,
+    _TELEMETRY_COPY_COLUMNS,
+    TelemetryProcessor,
+)
+
+
+def _bulk_event(student_id, session_id, event_type, data=None):
+    """Event dict in the shape bulk_ingest receives from the batch endpoint."""
+    return {
+        "event_id": str(uuid4()),
+        "student_id": student_id,
+        "event_type": event_type,
+        "data": data or {},
+        "session_id": session_id,
+        "mission_id": None,
+        "timestamp": datetime.now(timezone.utc),
+    }
 
 
 class TestTelemetryProcessor:
@@ -114,6 +143,184 @@ class TestTelemetryProcessor:
         assert processed[1].event_type == "choice_made"
         assert processed[2].event_type == "mission_complete"
 
+    @pytest.mark.asyncio
+    async def test_bulk_ingest_skips_stored_duplicates(
+        self, db_session_no_commit, test_student_no_commit
+    ):
+        """Events already stored are skipped but still count as received."""
+        processor = TelemetryProcessor(db_session_no_commit)
+        await processor.get_or_create_session(
+            student_id=test_student_no_commit.id, session_id="session-bulk-dup"
+        )
+        stored = _bulk_event(
+            test_student_no_commit.id, "session-bulk-dup", "mission_start"
+        )
+        await processor.bulk_ingest(events=[stored], batch_id="batch-bulk-1")
+
+        fresh = _bulk_event(
+            test_student_no_commit.id, "session-bulk-dup", "mission_complete"
+        )
+        accepted = await processor.bulk_ingest(
+            events=[stored, fresh], batch_id="batch-bulk-2"
+        )
+
+        assert accepted == 2
+        rows = (
+            await db_session_no_commit.execute(
+                select(GameTelemetry.id).where(
+                    GameTelemetry.session_id == "session-bulk-dup"
+                )
+            )
+        ).scalars()
+        assert sorted(rows) == sorted([stored["event_id"], fresh["event_id"]])
+
+    @pytest.mark.asyncio
+    async def test_bulk_ingest_skips_duplicates_within_batch(
+        self, db_session_no_commit, test_student_no_commit
+    ):
+        """An event repeated in one batch is stored once."""
+        processor = TelemetryProcessor(db_session_no_commit)
+        await processor.get_or_create_session(
+            student_id=test_student_no_commit.id, session_id="session-bulk-repeat"
+        )
+        event = _bulk_event(
+            test_student_no_commit.id, "session-bulk-repeat", "mission_start"
+        )
+        other = _bulk_event(
+            test_student_no_commit.id, "session-bulk-repeat", "mission_complete"
+        )
+
+        accepted = await processor.bulk_ingest(
+            events=[event, dict(event), other], batch_id="batch-bulk-repeat"
+        )
+
+        assert accepted == 3
+        count = await db_session_no_commit.scalar(
+            select(func.count())
+            .select_from(GameTelemetry)
+            .where(GameTelemetry.session_id == "session-bulk-repeat")
+        )
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_ingest_maps_choice_made(
+        self, db_session_no_commit, test_student_no_commit
+    ):
+        """choice_made is copied from data only for choice_made events."""
+        processor = TelemetryProcessor(db_session_no_commit)
+        await processor.get_or_create_session(
+            student_id=test_student_no_commit.id, session_id="session-bulk-choice"
+        )
+        choice = _bulk_event(
+            test_student_no_commit.id,
+            "session-bulk-choice",
+            "choice_made",
+            {"choice": "help_friend"},
+        )
+        other = _bulk_event(
+            test_student_no_commit.id,
+            "session-bulk-choice",
+            "mission_start",
+            {"choice": "x"},
+        )
+
+        await processor.bulk_ingest(events=[choice, other], batch_id="batch-choice")
+
+        rows = dict(
+            (
+                await db_session_no_commit.execute(
+                    select(GameTelemetry.id, GameTelemetry.choice_made).where(
+                        GameTelemetry.session_id == "session-bulk-choice"
+                    )
+                )
+            ).all()
+        )
+        assert rows[choice["event_id"]] == "help_friend"
+        assert rows[other["event_id"]] is None
+
+    @pytest.mark.asyncio
+    async def test_bulk_ingest_is_all_or_nothing(
+        self, db_session_no_commit, test_student_no_commit
+    ):
+        """One bad event fails the whole batch and stores nothing."""
+        processor = TelemetryProcessor(db_session_no_commit)
+        await processor.get_or_create_session(
+            student_id=test_student_no_commit.id, session_id="session-bulk-atomic"
+        )
+        good = _bulk_event(
+            test_student_no_commit.id, "session-bulk-atomic", "mission_start"
+        )
+        bad = _bulk_event(test_student_no_commit.id, "session-bulk-atomic", None)
+
+        # Savepoint so the failed write can be undone without ending the test
+        # transaction
+        with pytest.raises(Exception):
+            async with db_session_no_commit.begin_nested():
+                await processor.bulk_ingest(events=[good, bad], batch_id="batch-atomic")
+
+        count = await db_session_no_commit.scalar(
+            select(func.count())
+            .select_from(GameTelemetry)
+            .where(GameTelemetry.session_id == "session-bulk-atomic")
+        )
+        assert count == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "driver, row_count, expect_copy",
+        [
+            ("asyncpg", _COPY_MIN_ROWS + 1, True),
+            ("asyncpg", _COPY_MIN_ROWS, False),
+            ("aiosqlite", _COPY_MIN_ROWS + 1, False),
+        ],
+    )
+    async def test_bulk_ingest_write_path(self, driver, row_count, expect_copy):
+        """Large asyncpg batches use COPY; everything else uses executemany."""
+        copy_records = AsyncMock()
+        raw = MagicMock()
+        raw.driver_connection.copy_records_to_table = copy_records
+        conn = MagicMock()
+        conn.dialect.driver = driver
+        conn.get_raw_connection = AsyncMock(return_value=raw)
+        db = MagicMock()
+        db.connection = AsyncMock(return_value=conn)
+        db.execute = AsyncMock()
+        # The duplicate lookup is the first execute; it finds nothing
+        db.execute.return_value.scalars = MagicMock(return_value=[])
+        db.commit = AsyncMock()
+
+        events = [
+            _bulk_event(
+                "student-1", "session-1", "choice_made", {"choice": i, "note": "café"}
+            )
+            for i in range(row_count)
+        ]
+
+        processor = TelemetryProcessor(db)
+        accepted = await processor.bulk_ingest(events=events, batch_id="batch-path")
+
+        assert accepted == row_count
+        db.commit.assert_awaited_once()
+        if expect_copy:
+            copy_records.assert_awaited_once()
+            args, kwargs = copy_records.call_args
+            assert args == (GameTelemetry.__tablename__,)
+            assert kwargs["columns"] == _TELEMETRY_COPY_COLUMNS
+            records = kwargs["records"]
+            assert len(records) == row_count
+            record = dict(zip(_TELEMETRY_COPY_COLUMNS, records[0]))
+            assert record["id"] == events[0]["event_id"]
+            assert record["student_id"] == "student-1"
+            assert record["choice_made"] == 0
+            assert record["event_data"] == orjson.dumps(events[0]["data"]).decode()
+            # Only the duplicate lookup went through execute
+            assert db.execute.await_count == 1
+        else:
+            copy_records.assert_not_awaited()
+            assert db.execute.await_count == 2
+            rows = db.execute.await_args_list[1].args[1]
+            assert [row["id"] for row in rows] == [e["event_id"] for e in events]
+
     @pytest.mark.asyncio
     async def test_close_session_and_extract_features(
         self, db_session_no_commit, test_student_no_commit
@@ -352,6 +559,69 @@ class TestTelemetryEndpoints:
         assert data["received_count"] == 3
         assert data["batch_id"] == batch_id
 
+    @pytest.mark.asyncio
+    async def test_ingest_batch_body_too_large(
+        self, async_client: AsyncClient, auth_headers, mock_rate_limiter
+    ):
+        """Oversized batch bodies are refused with 413 while still streaming."""
+        chunk = b" " * 65536
+        chunks_sent = 0
+
+        async def body():
+            nonlocal chunks_sent
+            for _ in range(_MAX_BATCH_BODY_BYTES // len(chunk) + 50):
+                chunks_sent += 1
+                yield chunk
+
+        with patch.object(TelemetryProcessor, "bulk_ingest") as mock_bulk_ingest:
+            response = await async_client.post(
+                "/api/v1/telemetry/batch",
+                content=body(),
+                headers={**auth_headers, "Content-Type": "application/json"},
+            )
+
+        assert response.status_code == 413
+        # Reading stopped at the cap rather than draining the whole body
+        assert chunks_sent * len(chunk) <= _MAX_BATCH_BODY_BYTES + len(chunk)
+        mock_bulk_ingest.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ingest_batch_too_many_events(
+        self, async_client: AsyncClient, auth_headers, test_student, mock_rate_limiter
+    ):
+        """Batches over MAX_BATCH_EVENTS fail validation before any processing."""
+        session_id = str(uuid4())
+        event = {
+            "student_id": test_student.id,
+            "event_type": "mission_start",
+            "data": {},
+            "session_id": session_id,
+        }
+        batch_data = {
+            "batch_id": str(uuid4()),
+            "events": [
+                {**event, "event_id": str(uuid4())} for _ in range(MAX_BATCH_EVENTS + 1)
+            ],
+        }
+
+        with patch.object(
+            TelemetryProcessor, "get_or_create_session"
+        ) as mock_session, patch.object(
+            TelemetryProcessor, "bulk_ingest"
+        ) as mock_bulk_ingest:
+            response = await async_client.post(
+                "/api/v1/telemetry/batch",
+                json=batch_data,
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 422
+        errors = response.json()["detail"]
+        assert errors[0]["loc"] == ["body", "events"]
+        assert errors[0]["type"] == "too_long"
+        mock_session.assert_not_called()
+        mock_bulk_ingest.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_close_session(
         self,
@@ -433,3 +703,45 @@ class TestTelemetryEndpoints:
         # Check success rate
         success_count = sum(1 for r in results if r == 201)
         assert success_count >= 48  # Allow for some failures (96% success rate)
+
+
+def _event_payload(data):
+    """Minimal valid single-event payload carrying the given data."""
+    return {
+        "event_id": str(uuid4()),
+        "student_id": str(uuid4()),
+        "event_type": "choice_made",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "data": data,
+        "session_id": str(uuid4()),
+    }
+
+
+class TestTelemetryEventSchema:
+    """Test TelemetryEventCreate validation."""
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"t": "\u00e9" * 9000},  # each character serializes as a 6-byte escape
+            {"t": ['"' * 9000]},  # each quote is escaped
+            {"t": [0.123456789012345] * 900},  # full float repr
+        ],
+    )
+    def test_event_data_size_counts_serialized_bytes(self, data):
+        """Payloads under 10KB in characters but over it serialized are rejected."""
+        assert len(json.dumps(data)) > 10000
+
+        with pytest.raises(ValidationError, match="event_data too large"):
+            TelemetryEventCreate(**_event_payload(data))
+
+    def test_event_data_size_matches_json_dumps(self):
+        """The size estimate is exact while under budget."""
+        data = {
+            "choice": "help",
+            "scores": [1, 2.5, None, True, False],
+            "nested": {"text": 'caf\u00e9 "quoted"\n', "empty": {}},
+        }
+
+        assert _estimate_json_size(data, 10000) == len(json.dumps(data))
+        assert TelemetryEventCreate(**_event_payload(data)).data == data
@@ -1,9 +1,13 @@
 """Tests for transcription service and endpoints."""
 
+import hashlib
 import uuid
 import pytest
+from datetime import datetime, timezone
 from io import BytesIO
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+
+from sqlalchemy.exc import IntegrityError
 
 from app.models.audio import AudioFile
 from app.models.transcript import Transcript
@@ -327,6 +331,88 @@ class TestTranscriptionEndpoints:
             data = response.json()
             assert data["student_id"] == test_student.id
             assert data["transcription_status"] == "pending"
+            assert data["sha256"] == hashlib.sha256(file_content).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_upload_audio_duplicate_content(
+        self, async_client, auth_headers, db_session, test_student
+    ):
+        """Test re-uploading identical content returns the existing record."""
+        file_content = b"fake audio data"
+        data = {
+            "student_id": test_student.id,
+            "source_type": "classroom",
+        }
+
+        with patch(
+            "app.api.endpoints.transcription.TranscriptionService.upload_audio_to_gcs"
+        ) as mock_upload:
+            mock_upload.return_value = "gs://test-bucket/student-1/test.wav"
+
+            first = await async_client.post(
+                "/api/v1/audio/upload",
+                files={"file": ("test.wav", BytesIO(file_content), "audio/wav")},
+                data=data,
+                headers=auth_headers,
+            )
+            second = await async_client.post(
+                "/api/v1/audio/upload",
+                files={"file": ("again.wav", BytesIO(file_content), "audio/wav")},
+                data=data,
+                headers=auth_headers,
+            )
+
+            assert first.status_code == 201
+            assert second.status_code == 201
+            assert second.json()["id"] == first.json()["id"]
+            mock_upload.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_upload_audio_concurrent_duplicate(
+        self, async_client, auth_headers, db_session, test_student
+    ):
+        """Test losing a concurrent-upload race returns the winning record."""
+        file_content = b"fake audio data"
+        now = datetime.now(timezone.utc)
+        winner = AudioFile(
+            id=str(uuid.uuid4()),
+            student_id=test_student.id,
+            storage_path="gs://test-bucket/student-1/winner.wav",
+            file_size_bytes=len(file_content),
+            source_type="classroom",
+            transcription_status="pending",
+            sha256=hashlib.sha256(file_content).hexdigest(),
+            created_at=now,
+            updated_at=now,
+        )
+
+        with patch(
+            "app.api.endpoints.transcription.TranscriptionService.upload_audio_to_gcs"
+        ) as mock_upload, patch(
+            "app.api.endpoints.transcription.TranscriptionService.delete_audio_from_gcs"
+        ) as mock_delete, patch(
+            "app.api.endpoints.transcription._find_audio_by_sha256",
+            side_effect=[None, winner],
+        ), patch.object(
+            db_session,
+            "commit",
+            AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("dup"))),
+        ), patch.object(
+            db_session, "rollback", AsyncMock()
+        ):
+            mock_upload.return_value = "gs://test-bucket/student-1/test.wav"
+
+            response = await async_client.post(
+                "/api/v1/audio/upload",
+                files={"file": ("test.wav", BytesIO(file_content), "audio/wav")},
+                data={"student_id": test_student.id, "source_type": "classroom"},
+                headers=auth_headers,
+            )
+
+            assert response.status_code == 201
+            assert response.json()["id"] == winner.id
+            uploaded_name = mock_upload.call_args.args[1]
+            mock_delete.assert_awaited_once_with(uploaded_name)
 
     @pytest.mark.asyncio
     async def test_upload_audio_student_not_found(self, async_client, auth_headers):